@@ -42,7 +42,9 @@ class LSPConfig:
     auto_detect: bool = True
     lazy_load: bool = True
     auto_install: bool = True  # Auto-install missing LSP servers
-    timeout_ms: int = 2000
+    timeout_ms: int = 2000  # hover, definition, references, symbols
+    completion_timeout_ms: int = 3000
+    rename_timeout_ms: int = 5000
     languages: Optional[List[str]] = None
     disabled_languages: List[str] = field(default_factory=list)
     # Language-specific configs
@@ -189,6 +191,8 @@ def load_config(project_path: Path) -> OtterConfig:
         config.lsp.lazy_load = lsp_data.get("lazy_load", True)
         config.lsp.auto_install = lsp_data.get("auto_install", True)
         config.lsp.timeout_ms = lsp_data.get("timeout_ms", 2000)
+        config.lsp.completion_timeout_ms = lsp_data.get("completion_timeout_ms", 3000)
+        config.lsp.rename_timeout_ms = lsp_data.get("rename_timeout_ms", 5000)
         config.lsp.languages = lsp_data.get("languages")
         config.lsp.disabled_languages = lsp_data.get("disabled_languages", [])
 
@@ -261,6 +265,34 @@ def load_config(project_path: Path) -> OtterConfig:
     return config
 
 
+# File extension to language mapping
+EXTENSION_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".rs": "rust",
+    ".go": "go",
+    ".lua": "lua",
+}
+
+# Directories never worth scanning for source files
+IGNORED_DIRS = {
+    ".git",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "env",
+    "target",
+    "build",
+    "dist",
+    ".next",
+    ".cache",
+}
+
+
 def detect_project_languages(project_path: Path) -> List[str]:
     """Auto-detect languages used in the project.
 
@@ -270,18 +302,6 @@ def detect_project_languages(project_path: Path) -> List[str]:
     Returns:
         List of detected language names
     """
-    # File extension to language mapping
-    extension_map = {
-        ".py": "python",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".rs": "rust",
-        ".go": "go",
-        ".lua": "lua",
-    }
-
     detected = set()
 
     # Walk through project (limit depth to avoid deep traversal)
@@ -294,29 +314,12 @@ def detect_project_languages(project_path: Path) -> List[str]:
             continue
 
         # Skip common directories to ignore
-        dirs[:] = [
-            d
-            for d in dirs
-            if d
-            not in {
-                ".git",
-                "node_modules",
-                "__pycache__",
-                ".venv",
-                "venv",
-                "env",
-                "target",
-                "build",
-                "dist",
-                ".next",
-                ".cache",
-            }
-        ]
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
 
         for file in files:
             ext = Path(file).suffix
-            if ext in extension_map:
-                detected.add(extension_map[ext])
+            if ext in EXTENSION_LANGUAGES:
+                detected.add(EXTENSION_LANGUAGES[ext])
 
     return sorted(detected)
 
@@ -8,10 +8,24 @@ from __future__ import annotations
 import asyncio
 import atexit
 import os
+import re
 import signal
-from dataclasses import asdict
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import fields
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 from mcp.server import FastMCP
 
@@ -20,6 +34,12 @@ from .server import CliIdeServer
 # Global IDE server instance and project path
 _ide_server: Optional[CliIdeServer] = None
 _project_path: Optional[str] = None
+# Held while the IDE server starts: tool calls that arrive during the background
+# startup wait for it instead of getting a server that is not started yet
+_ide_start_lock = asyncio.Lock()
+
+# Expensive calls currently running, keyed by tool name + arguments (single-flight)
+_inflight: Dict[Hashable, asyncio.Future[Any]] = {}
 
 
 def _get_server_name() -> str:
@@ -39,8 +59,35 @@ def _get_server_description() -> str:
     )
 
 
+async def _start_ide_and_warm_index() -> None:
+    """Start the IDE server, then prewarm its LSP index (background task)."""
+    try:
+        ide = await get_ide_server()
+    except Exception as e:
+        sys.stderr.write(f"⚠️  IDE startup deferred: {e}\n")
+        return
+    await ide.warm_index()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start the IDE and prewarm the LSP index in the background.
+
+    The MCP handshake does not wait for Neovim: startup and indexing overlap
+    with idle time instead of landing on the first tool call, and a tool call
+    that arrives early waits in get_ide_server() for startup to finish.
+    Startup failures are reported but not fatal.
+    """
+    _prebuild_converters()
+    warm_task = asyncio.create_task(_start_ide_and_warm_index())
+    try:
+        yield
+    finally:
+        warm_task.cancel()
+
+
 # Create the FastMCP server with initial name (will be updated when project path is set)
-mcp = FastMCP("CLI IDE for Agents")
+mcp = FastMCP("CLI IDE for Agents", lifespan=_lifespan)
 
 
 def set_project_path(path: str) -> None:
@@ -63,15 +110,18 @@ def _update_server_info() -> None:
 async def get_ide_server() -> CliIdeServer:
     """Get or create the IDE server instance."""
     global _ide_server, _project_path
-    if _ide_server is None:
-        # Use environment variable or current directory if not set
-        project_path = _project_path or os.getenv("IDE_PROJECT_PATH") or os.getcwd()
-        if not _project_path:
-            # Set it if it wasn't already set
-            _project_path = project_path
-        _update_server_info()
-        _ide_server = CliIdeServer(project_path=project_path)
-        await _ide_server.start()
+    if _ide_server is not None and not _ide_start_lock.locked():
+        return _ide_server
+    async with _ide_start_lock:
+        if _ide_server is None:
+            # Use environment variable or current directory if not set
+            project_path = _project_path or os.getenv("IDE_PROJECT_PATH") or os.getcwd()
+            if not _project_path:
+                # Set it if it wasn't already set
+                _project_path = project_path
+            _update_server_info()
+            _ide_server = CliIdeServer(project_path=project_path)
+            await _ide_server.start()
     return _ide_server
 
 
@@ -118,10 +168,82 @@ def _setup_cleanup_handlers() -> None:
     signal.signal(signal.SIGINT, signal_handler)
 
 
+# Dict converters per dataclass type (prebuilt at server startup for
+# the response models, built on first use for anything else)
+_CONVERTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+# Field annotations whose values are passed through without recursing: scalars,
+# and string-keyed dicts of plain data (Dict[str, Any] fields such as
+# ProjectTree.tree hold JSON-ready values only, never models)
+_SCALAR_ANNOTATION = re.compile(
+    r"(Optional\[)?(str|int|float|bool|Literal\[.*\]"
+    r"|Dict\[str, (str|Any|List\[str\])\])\]?"
+)
+# Results with fewer items than this are converted on the event loop (a few ms
+# at most); larger ones go to a worker thread
+_OFFLOAD_MIN_ITEMS = 1000
+
+
+def _build_converter(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Build a function returning cls's fields as a dict.
+
+    The field list is fixed per class, so instead of reflecting over fields()
+    for every object we work out once per class which fields need converting.
+    Fields annotated as scalars or plain-data dicts are copied as-is;
+    everything else goes through _to_builtins.
+    """
+    plan = tuple(
+        (
+            f.name,
+            not (isinstance(f.type, str) and _SCALAR_ANNOTATION.fullmatch(f.type)),
+        )
+        for f in fields(cls)
+    )
+
+    def convert(obj: Any) -> Dict[str, Any]:
+        return {
+            name: _to_builtins(getattr(obj, name)) if recurse else getattr(obj, name)
+            for name, recurse in plan
+        }
+
+    return convert
+
+
+def _prebuild_converters() -> None:
+    """Build the converters of every response model ahead of the first call."""
+    from .models import responses
+
+    for name in responses.__all__:
+        cls = getattr(responses, name)
+        if hasattr(cls, "__dataclass_fields__") and cls not in _CONVERTERS:
+            _CONVERTERS[cls] = _build_converter(cls)
+
+
+def _to_builtins(obj: Any) -> Any:
+    """Recursively turn dataclasses into dicts, leaving leaf values as they are.
+
+    Unlike dataclasses.asdict() this does not deep-copy leaf values - response
+    objects are built fresh per call, so sharing them is safe.
+    """
+    cls = type(obj)
+    if cls in _SCALAR_TYPES:
+        return obj
+    convert = _CONVERTERS.get(cls)
+    if convert is None and hasattr(cls, "__dataclass_fields__"):
+        convert = _CONVERTERS[cls] = _build_converter(cls)
+    if convert is not None:
+        return convert(obj)
+    if isinstance(obj, (list, tuple)):
+        return [_to_builtins(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: _to_builtins(v) for k, v in obj.items()}
+    return obj
+
+
 def _to_dict(obj: Any) -> dict[str, Any]:
     """Convert dataclass objects to dictionaries for JSON serialization."""
     if hasattr(obj, "__dataclass_fields__"):
-        result = asdict(obj)
+        result = _to_builtins(obj)
         return result if isinstance(result, dict) else {}
     elif isinstance(obj, list):
         return {"items": [_to_dict(item) for item in obj]}
@@ -130,6 +252,50 @@ def _to_dict(obj: Any) -> dict[str, Any]:
     return {"value": obj}  # Wrap non-dict objects
 
 
+async def _to_dict_offloaded(obj: Any, size: int) -> dict[str, Any]:
+    """_to_dict() in a worker thread for results of at least _OFFLOAD_MIN_ITEMS.
+
+    Project-wide diagnostics can hold tens of thousands of objects; converting
+    them on the event loop would stall every other tool call. Smaller results
+    are converted inline, where the thread hand-off would cost more than it
+    saves (the conversion holds the GIL either way).
+
+    Args:
+        obj: Result to convert
+        size: Number of items in the result (e.g. diagnostics)
+    """
+    if size < _OFFLOAD_MIN_ITEMS:
+        return _to_dict(obj)
+    return await asyncio.to_thread(_to_dict, obj)
+
+
+async def _single_flight(key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run call() once for concurrent requests with the same key.
+
+    Identical expensive tool calls (LLM summaries, LSP symbol queries, tree
+    walks) issued in parallel share one result - or exception - instead of
+    each paying for it. The call runs as its own task, so a caller that is
+    cancelled (client gone, timeout) leaves the others waiting on it. Nothing
+    is cached once the call finishes.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _single_flight_done(key, done))
+    return await asyncio.shield(task)
+
+
+def _single_flight_done(key: Hashable, task: asyncio.Future[Any]) -> None:
+    """Forget a finished single-flight call."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Consume the exception so a call nobody awaits anymore doesn't log
+    # "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
 # ============================================================================
 # QUICK START GUIDE
 # ============================================================================
@@ -243,7 +409,10 @@ async def find_definition(
         Symbol-only search (grep-based) is not yet implemented.
     """
     ide = await get_ide_server()
-    result = await ide.find_definition(symbol, file, line)
+    result = await _single_flight(
+        ("find_definition", symbol, file, line),
+        lambda: ide.find_definition(symbol, file, line),
+    )
     return _to_dict(result)
 
 
@@ -282,7 +451,10 @@ async def find_references(
         find_references("UserModel", file="models.py", line=5, exclude_definition=True)
     """
     ide = await get_ide_server()
-    result = await ide.find_references(symbol, file, line, scope, exclude_definition)
+    result = await _single_flight(
+        ("find_references", symbol, file, line, scope, exclude_definition),
+        lambda: ide.find_references(symbol, file, line, scope, exclude_definition),
+    )
     return _to_dict(result)
 
 
@@ -331,7 +503,10 @@ async def get_hover_info(
         get_hover_info(file="server.py", symbol="User", line=45)
     """
     ide = await get_ide_server()
-    result = await ide.get_hover_info(file, symbol, line, column)
+    result = await _single_flight(
+        ("get_hover_info", file, symbol, line, column),
+        lambda: ide.get_hover_info(file, symbol, line, column),
+    )
     return _to_dict(result)
 
 
@@ -374,7 +549,10 @@ async def get_completions(
         get_completions("server.py", line=83, column=9, max_results=0)
     """
     ide = await get_ide_server()
-    result = await ide.get_completions(file, line, column, max_results)
+    result = await _single_flight(
+        ("get_completions", file, line, column, max_results),
+        lambda: ide.get_completions(file, line, column, max_results),
+    )
     return _to_dict(result)
 
 
@@ -446,8 +624,18 @@ async def get_project_structure(
             - total_size: Sum of file sizes in bytes (0 if include_sizes=False)
     """
     ide = await get_ide_server()
-    result = await ide.get_project_structure(
-        path, max_depth, show_hidden, include_sizes, exclude_patterns
+    result = await _single_flight(
+        (
+            "get_project_structure",
+            path,
+            max_depth,
+            show_hidden,
+            include_sizes,
+            tuple(exclude_patterns or ()),
+        ),
+        lambda: ide.get_project_structure(
+            path, max_depth, show_hidden, include_sizes, exclude_patterns
+        ),
     )
     return _to_dict(result)
 
@@ -478,7 +666,10 @@ async def get_symbols(
             - children: Nested symbols (methods in classes, etc.)
     """
     ide = await get_ide_server()
-    result = await ide.get_symbols(file, symbol_types)
+    result = await _single_flight(
+        ("get_symbols", file, tuple(symbol_types or ())),
+        lambda: ide.get_symbols(file, symbol_types),
+    )
     return _to_dict(result)
 
 
@@ -581,7 +772,10 @@ async def summarize_code(
         # → "Payment processing service integrating Stripe and PayPal..."
     """
     ide = await get_ide_server()
-    result = await ide.summarize_code(file, detail_level)
+    result = await _single_flight(
+        ("summarize_code", file, detail_level),
+        lambda: ide.summarize_code(file, detail_level),
+    )
     return _to_dict(result)
 
 
@@ -738,7 +932,10 @@ async def explain_symbol(
         #    logging, and error wrapping."
     """
     ide = await get_ide_server()
-    result = await ide.explain_symbol(file, line, character, include_references)
+    result = await _single_flight(
+        ("explain_symbol", file, line, character, include_references),
+        lambda: ide.explain_symbol(file, line, character, include_references),
+    )
     return _to_dict(result)
 
 
@@ -770,7 +967,7 @@ async def get_diagnostics(
     """
     ide = await get_ide_server()
     result = await ide.get_diagnostics(file, severity, include_fixes)
-    return _to_dict(result)
+    return await _to_dict_offloaded(result, len(result.diagnostics))
 
 
 @mcp.tool()
@@ -789,7 +986,10 @@ async def analyze_dependencies(
         Dependency graph showing imports and reverse dependencies
     """
     ide = await get_ide_server()
-    result = await ide.analyze_dependencies(file, direction)
+    result = await _single_flight(
+        ("analyze_dependencies", file, direction),
+        lambda: ide.analyze_dependencies(file, direction),
+    )
     return _to_dict(result)
 
 
@@ -1938,8 +2138,6 @@ def main() -> None:
     Example:
         IDE_PROJECT_PATH=/path/to/project python -m cli_ide.mcp_server
     """
-    import sys
-
     # Set up cleanup handlers FIRST to ensure proper shutdown
     _setup_cleanup_handlers()
 
@@ -1957,10 +2155,13 @@ def main() -> None:
         set_project_path(project_path)
 
     # Print server info to stderr (stdout is used for MCP protocol)
-    print("🚀 Starting CLI IDE MCP Server", file=sys.stderr)
-    print(f"📁 Project: {project_name}", file=sys.stderr)
-    print(f"📂 Path: {project_path}", file=sys.stderr)
-    print("", file=sys.stderr)
+    # as a single write, so it lands in one syscall
+    sys.stderr.write(
+        "🚀 Starting CLI IDE MCP Server\n"
+        f"📁 Project: {project_name}\n"
+        f"📂 Path: {project_path}\n\n"
+    )
+    sys.stderr.flush()
 
     # FastMCP handles the server lifecycle and stdio communication
     # Just run mcp.run() which will start the server
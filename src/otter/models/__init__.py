@@ -1,5 +1,4 @@
 """Shared models for requests and responses."""
 
 from .responses import *  # noqa: F403 - intentional re-export
-
-__all__ = [name for name in dir() if not name.startswith("_")]
+from .responses import __all__ as __all__
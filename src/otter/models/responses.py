@@ -1,11 +1,22 @@
+"""Response models returned by the IDE tools.
+
+Models are built once per call and serialized, never compared, so they are
+declared with eq=False, repr=False (DebugSession and IDEError keep their repr
+for debugging).
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+# Shared default for collection fields that are often left empty - a fresh
+# list per instance would be allocated (and GC-tracked) for nothing
+_EMPTY: Tuple[Any, ...] = ()
 
 
 # Core navigation
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Definition:
     file: str
     line: int
@@ -18,14 +29,12 @@ class Definition:
     signature: Optional[str] = (
         None  # Present for functions/methods, null for classes/variables
     )
-    context_lines: List[str] = field(
-        default_factory=list
-    )  # Lines with format "LINE_NUM|CONTENT"
+    context_lines: Sequence[str] = _EMPTY  # Lines with format "LINE_NUM|CONTENT"
     source_module: Optional[str] = None
     has_alternatives: bool = False  # True if LSP returned multiple possible definitions
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Reference:
     file: str
     line: int
@@ -35,25 +44,25 @@ class Reference:
     reference_type: Optional[str] = None  # e.g., "import", "usage", "type_hint"
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class FileReferences:
     """References grouped by file."""
 
     file: str
     count: int
-    references: List[Reference] = field(default_factory=list)
+    references: Sequence[Reference] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ReferencesResult:
     """Structured result for find_references with grouping and metadata."""
 
     references: List[Reference]
     total_count: int
-    grouped_by_file: List[FileReferences] = field(default_factory=list)
+    grouped_by_file: Sequence[FileReferences] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class SearchResult:
     file: str
     line: int
@@ -62,7 +71,7 @@ class SearchResult:
 
 
 # Code intelligence
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class CompletionsResult:
     """Structured result for code completions with metadata."""
 
@@ -72,7 +81,7 @@ class CompletionsResult:
     truncated: bool  # True if results were limited by max_results
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class HoverInfo:
     symbol: str
     type: Optional[str]
@@ -82,7 +91,7 @@ class HoverInfo:
     column: Optional[int] = None  # Position where hover was requested
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Completion:
     text: str
     kind: Optional[str] = None
@@ -92,7 +101,7 @@ class Completion:
 
 
 # Files & projects
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class FileContent:
     content: str
     total_lines: int  # Total number of lines in the file
@@ -101,7 +110,7 @@ class FileContent:
     language: Optional[str] = None  # File language (e.g., "python", "javascript")
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ProjectTree:
     """Directory tree structure with metadata.
 
@@ -123,7 +132,7 @@ class ProjectTree:
     total_size: int = 0  # Total size of all files in bytes (0 if include_sizes=False)
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Symbol:
     """Symbol information from LSP document symbols.
 
@@ -135,7 +144,7 @@ class Symbol:
     type: str  # Symbol type: "class", "function", "method", "variable", etc.
     line: int  # Line number (1-indexed)
     column: int = 0  # Column number (0-indexed, matching LSP)
-    children: Optional[List["Symbol"]] = None  # Nested symbols (methods in class, etc.)
+    children: Sequence["Symbol"] = _EMPTY  # Nested symbols (methods in class, etc.)
     parent: Optional[str] = None  # Parent symbol name for hierarchy
     signature: Optional[str] = (
         None  # Function/method signature with params and return type
@@ -146,7 +155,7 @@ class Symbol:
     )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class SymbolsResult:
     """Result of get_symbols with metadata.
 
@@ -160,7 +169,7 @@ class SymbolsResult:
 
 
 # Refactoring
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Change:
     file: str
     line: int
@@ -168,35 +177,35 @@ class Change:
     after: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RenamePreview:
     changes: List[Change]
     affected_files: int
     total_changes: int
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RenameResult:
     changes_applied: int
     files_updated: int
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ExtractResult:
     new_function_name: str
     changes: List[Change]
 
 
 # Smart/Semantic
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class CodeExplanation:
     summary: str
-    key_operations: List[str] = field(default_factory=list)
+    key_operations: Sequence[str] = _EMPTY
     complexity: Optional[str] = None
-    potential_issues: Optional[List[str]] = None
+    potential_issues: Sequence[str] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Improvement:
     line: int
     issue: str
@@ -204,27 +213,27 @@ class Improvement:
     example: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class SemanticDiff:
     summary: str
-    changes: List[str] = field(default_factory=list)
+    changes: Sequence[str] = _EMPTY
 
 
 # Diagnostics & analysis
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Fix:
     description: str
     edit: Any
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RelatedInfo:
     message: str
     file: Optional[str] = None
     line: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Diagnostic:
     severity: Literal["error", "warning", "info", "hint"]
     message: str
@@ -233,10 +242,10 @@ class Diagnostic:
     column: int
     source: Optional[str] = None
     fix: Optional[Fix] = None
-    related_information: List[RelatedInfo] = field(default_factory=list)
+    related_information: Sequence[RelatedInfo] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class DiagnosticsResult:
     """Result containing diagnostics with metadata.
 
@@ -249,14 +258,14 @@ class DiagnosticsResult:
     file: Optional[str] = None  # File that was analyzed, if specific file requested
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class DependencyGraph:
     file: str
-    imports: List[str] = field(default_factory=list)
-    imported_by: List[str] = field(default_factory=list)
+    imports: Sequence[str] = _EMPTY
+    imported_by: Sequence[str] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class TestResults:
     total: int
     passed: int
@@ -264,21 +273,21 @@ class TestResults:
     output: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ExecutionTrace:
     calls: List[Dict[str, Any]]
     variables: Dict[str, Any]
     duration_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class WorkspaceDiff:
-    added: List[str] = field(default_factory=list)
-    modified: List[str] = field(default_factory=list)
-    deleted: List[str] = field(default_factory=list)
+    added: Sequence[str] = _EMPTY
+    modified: Sequence[str] = _EMPTY
+    deleted: Sequence[str] = _EMPTY
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ShellResult:
     command: str
     return_code: int
@@ -286,16 +295,16 @@ class ShellResult:
     stderr: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class IDEError:
     error_type: str
     message: str
-    suggestions: List[str] = field(default_factory=list)
+    suggestions: Sequence[str] = _EMPTY
     context: Dict[str, Any] = field(default_factory=dict)
 
 
 # Debugging (DAP)
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BreakpointInfo:
     id: int
     file: str
@@ -306,7 +315,7 @@ class BreakpointInfo:
     log_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class StackFrame:
     id: int
     name: str
@@ -316,7 +325,7 @@ class StackFrame:
     source: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Variable:
     name: str
     value: str
@@ -324,24 +333,24 @@ class Variable:
     variables_reference: int = 0  # For nested objects
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Scope:
     name: str
     variables_reference: int
     expensive: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ExecutionState:
     session_id: str
     status: Literal["running", "paused", "stopped", "exited"]
     reason: Optional[str] = None  # For paused: "breakpoint", "step", "exception", etc.
     thread_id: Optional[int] = None
-    stack_frames: List[StackFrame] = field(default_factory=list)
+    stack_frames: Sequence[StackFrame] = _EMPTY
     breakpoint_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DebugSession:
     session_id: str
     status: Literal[
@@ -350,7 +359,7 @@ class DebugSession:
     file: Optional[str] = None  # File being debugged (None for module launches)
     module: Optional[str] = None  # Module being debugged (e.g., "uvicorn")
     configuration: Optional[str] = None  # Name of the debug configuration used
-    breakpoints: List[BreakpointInfo] = field(default_factory=list)
+    breakpoints: Sequence[BreakpointInfo] = _EMPTY
     current_line: Optional[int] = None
     current_file: Optional[str] = None
     output: str = ""  # Combined stdout+stderr (for backwards compatibility)
@@ -373,12 +382,12 @@ class DebugSession:
     launch_args: Optional[List[str]] = None  # Command-line arguments used
     launch_env: Optional[Dict[str, str]] = None  # Environment variables used
     launch_cwd: Optional[str] = None  # Working directory used
-    diagnostic_info: List[str] = field(
-        default_factory=list
-    )  # Diagnostic logs (DAP config, initialization events, etc.)
+    diagnostic_info: Sequence[str] = (
+        _EMPTY  # Diagnostic logs (DAP config, initialization events, etc.)
+    )
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class EvaluateResult:
     result: str
     type: Optional[str] = None
@@ -386,7 +395,7 @@ class EvaluateResult:
 
 
 # AI-Powered Analysis
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class CodeSummary:
     """Summary of code content."""
 
@@ -395,7 +404,7 @@ class CodeSummary:
     detail_level: Literal["brief", "detailed"]
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ChangeSummary:
     """Summary of code changes (diff)."""
 
@@ -404,7 +413,7 @@ class ChangeSummary:
     git_ref: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ReviewResult:
     """Result of quick code review."""
 
@@ -413,7 +422,7 @@ class ReviewResult:
     focus_areas: List[str]  # What was reviewed
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ErrorExplanation:
     """Explanation of an error message."""
 
@@ -424,7 +433,7 @@ class ErrorExplanation:
 
 
 # Buffer Editing
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BufferEdit:
     """Single edit operation."""
 
@@ -433,7 +442,7 @@ class BufferEdit:
     new_text: str  # Replacement text (may contain multiple lines)
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BufferInfo:
     """Information about a buffer."""
 
@@ -444,7 +453,7 @@ class BufferInfo:
     language: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class EditResult:
     """Result of buffer editing operation."""
 
@@ -457,7 +466,7 @@ class EditResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class SaveResult:
     """Result of saving a buffer to disk."""
 
@@ -467,7 +476,7 @@ class SaveResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class DiscardResult:
     """Result of discarding buffer changes."""
 
@@ -477,7 +486,7 @@ class DiscardResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BufferDiff:
     """Diff between buffer and disk version."""
 
@@ -487,7 +496,7 @@ class BufferDiff:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class FindReplaceResult:
     """Result of find-and-replace operation."""
 
@@ -3,14 +3,81 @@ from __future__ import annotations
 import asyncio
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
 
 import pynvim  # type: ignore
 
 from ..bootstrap import check_and_install_lsp_servers
 from ..config import get_effective_languages, load_config
 
+# Retry interval while waiting for Neovim's socket to accept connections
+_STARTUP_POLL_INTERVAL = 0.01
+
+# Maximum number of cached hover, definition and completion results
+_LSP_CACHE_SIZE = 256
+
+# Sum of the changedticks of all loaded buffers, and their count: any edit to
+# any buffer (including workspace edits applied in Lua) changes it
+_BUFFERS_STAMP_LUA = """
+local total, count = 0, 0
+for _, b in ipairs(vim.api.nvim_list_bufs()) do
+    if vim.api.nvim_buf_is_loaded(b) then
+        total = total + vim.api.nvim_buf_get_changedtick(b)
+        count = count + 1
+    end
+end
+return { total, count }
+"""
+
+# Runs a chunk with its arguments and returns its result together with the
+# buffers stamp taken just before it ran, in one request
+_STAMPED_CALL_LUA = (
+    "local code, args = ...\n"
+    "local stamp = (function()\n" + _BUFFERS_STAMP_LUA + "end)()\n"
+    "return { stamp = stamp, result = assert(load(code))(unpack(args, 1, #args)) }\n"
+)
+
+
+def _disk_mtime(path: str) -> Optional[int]:
+    """Modification time of a file in ns, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _location_mtimes(result: Any) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """(path, disk mtime) of every file a list of LSP locations points into."""
+    if not isinstance(result, list):
+        return ()
+    paths = set()
+    for location in result:
+        if isinstance(location, dict):
+            uri = location.get("uri") or location.get("targetUri")
+            if isinstance(uri, str) and uri.startswith("file://"):
+                paths.add(unquote(urlparse(uri).path))
+    return tuple((path, _disk_mtime(path)) for path in paths)
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count lines the way readlines() would, without holding them in memory."""
+    count = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
+
+def _new_rpc_executor() -> ThreadPoolExecutor:
+    """Single-thread executor that runs every pynvim call of a client."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="nvim-rpc")
+
 
 class NeovimClient:
     """Async wrapper over a headless Neovim instance.
@@ -29,8 +96,29 @@ class NeovimClient:
         self.socket_path = socket_path or self._create_socket_path()
         self.nvim: Optional[pynvim.Nvim] = None
         self._process: Optional[asyncio.subprocess.Process] = None
+        # pynvim sessions are not thread-safe: every RPC runs on this one thread,
+        # so concurrent callers queue up instead of sharing the socket
+        self._rpc_executor = _new_rpc_executor()
+        # Second connection (with its own thread) for slow LSP requests, so a
+        # long rename doesn't hold up hovers queued on the main connection
+        self._nvim_slow: Optional[pynvim.Nvim] = None
+        self._slow_executor = _new_rpc_executor()
         self._buffers: Dict[str, int] = {}  # filepath -> buffer number
         self._lsp_clients: Dict[str, Any] = {}  # filetype -> LSP client info
+        # buffer number -> (changedtick, documentSymbol result)
+        self._symbols_cache: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
+        # filepath -> disk mtime (ns) when the buffer last matched the file
+        self._buffer_mtimes: Dict[str, Optional[int]] = {}
+        # filepath as given -> resolved absolute path
+        self._path_cache: Dict[str, Path] = {}
+        # buffer numbers already seen with an initialized LSP client
+        self._lsp_attached: Set[int] = set()
+        # (method, buffer, position...) ->
+        #     (buffers stamp, (path, mtime) of files in the result, LSP result)
+        self._lsp_cache: Dict[
+            Tuple[Any, ...],
+            Tuple[Tuple[int, int], Tuple[Tuple[str, Optional[int]], ...], Any],
+        ] = {}
         self._started = False
 
         # Load configuration
@@ -90,30 +178,16 @@ class NeovimClient:
             stderr=asyncio.subprocess.PIPE,
         )
 
-        # Give Neovim time to start and create the socket
-        # Wait for socket file to exist
-        socket_timeout = 3.0
-        socket_start = asyncio.get_event_loop().time()
-        while not os.path.exists(self.socket_path):
-            if asyncio.get_event_loop().time() - socket_start > socket_timeout:
-                await self.stop()
-                raise RuntimeError(f"Socket file not created: {self.socket_path}")
-            await asyncio.sleep(0.1)
-
-        # Give it a bit more time to be ready
-        await asyncio.sleep(0.2)
-
-        # Connect to the Neovim instance (run in executor to avoid event loop conflicts)
-        loop = asyncio.get_event_loop()
+        # Connect to the Neovim instance (run in executor to avoid event loop
+        # conflicts). Connecting is retried until Neovim listens, so there is
+        # no separate wait for the socket file to appear
         try:
-            self.nvim = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None, lambda: pynvim.attach("socket", path=self.socket_path)
-                ),
-                timeout=5.0,
-            )
+            self.nvim = await asyncio.wait_for(self._attach(), timeout=8.0)
         except asyncio.TimeoutError:
+            socket_created = os.path.exists(self.socket_path)
             await self.stop()
+            if not socket_created:
+                raise RuntimeError(f"Socket file not created: {self.socket_path}")
             raise RuntimeError(
                 f"Timeout connecting to Neovim socket: {self.socket_path}"
             )
@@ -121,11 +195,42 @@ class NeovimClient:
             await self.stop()
             raise RuntimeError(f"Failed to connect to Neovim: {e}")
 
+        # Neovim is listening now; without the slow lane, slow requests
+        # share the main connection
+        try:
+            self._nvim_slow = await asyncio.get_running_loop().run_in_executor(
+                self._slow_executor,
+                lambda: pynvim.attach("socket", path=self.socket_path),
+            )
+        except Exception:
+            self._nvim_slow = None
+
         # Wait for config to load
         await self._wait_for_config()
 
         self._started = True
 
+    async def _attach(self) -> pynvim.Nvim:
+        """Connect to the socket, retrying until Neovim accepts connections.
+
+        A missing socket or a refused connection just means Neovim isn't
+        listening yet, so this connects as soon as it is instead of after a
+        fixed delay.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                return await loop.run_in_executor(
+                    self._rpc_executor,
+                    lambda: pynvim.attach("socket", path=self.socket_path),
+                )
+            except (ConnectionRefusedError, FileNotFoundError):
+                if self._process and self._process.returncode is not None:
+                    raise RuntimeError(
+                        f"Neovim exited with code {self._process.returncode}"
+                    )
+                await asyncio.sleep(_STARTUP_POLL_INTERVAL)
+
     def _generate_runtime_config(self, config_dir: Path) -> None:
         """Generate runtime_config.lua with all settings.
 
@@ -228,45 +333,41 @@ end
         return defaults.get(lang, lang)
 
     async def _wait_for_config(self, timeout: float = 5.0) -> None:
-        """Wait for Neovim config to finish loading."""
-        loop = asyncio.get_event_loop()
-        start_time = loop.time()
-
-        while True:
-            try:
-                if not self.nvim:
-                    raise RuntimeError("Neovim not connected")
-                # Run eval in executor to avoid blocking, with timeout
-                loaded = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: self.nvim.eval("get(g:, 'ide_config_loaded', 0)")
-                        if self.nvim
-                        else 0,
-                    ),
-                    timeout=1.0,  # 1 second timeout per check
-                )
-                if loaded:
-                    break
-            except asyncio.TimeoutError:
-                # If individual check times out, continue trying
-                pass
-            except Exception:
-                pass
+        """Wait for Neovim config to finish loading.
 
-            if loop.time() - start_time > timeout:
-                # For now, just log and continue - config might not set the flag
-                # This makes it work even if lazy.nvim isn't fully loaded
-                break
+        Neovim does the waiting itself (vim.wait on the ide_config_loaded flag),
+        so this returns as soon as the flag is set, in a single request.
+        """
+        if not self.nvim:
+            return
 
-            await asyncio.sleep(0.1)
+        loop = asyncio.get_running_loop()
+        timeout_ms = int(timeout * 1000)
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._rpc_executor,
+                    lambda: self.nvim.exec_lua(
+                        "return vim.wait(..., function()"
+                        " return vim.g.ide_config_loaded end, 10)",
+                        timeout_ms,
+                    )
+                    if self.nvim
+                    else None,
+                ),
+                timeout=timeout + 1.0,
+            )
+        except Exception:
+            # For now, just continue - config might not set the flag
+            # This makes it work even if lazy.nvim isn't fully loaded
+            pass
 
     async def _send_config_to_nvim(self) -> None:
         """Send Otter configuration to Neovim."""
         if not self.nvim:
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         try:
             # Prepare config data to send to Lua
@@ -322,7 +423,7 @@ end
 
             # Send config to Neovim's global scope
             await loop.run_in_executor(
-                None,
+                self._rpc_executor,
                 lambda: self.nvim.lua.exec(
                     f"_G.otter_config = {self._lua_repr(config_data)}"
                 )
@@ -365,13 +466,15 @@ end
         try:
             # Check if LSP is available (run in executor with timeout)
             if self.nvim:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 has_lsp = await asyncio.wait_for(
                     loop.run_in_executor(
-                        None,
-                        lambda: self.nvim.eval("vim.fn.exists('*vim.lsp.get_clients')")
+                        self._rpc_executor,
+                        lambda: self.nvim.exec_lua(
+                            "return vim.lsp ~= nil and vim.lsp.get_clients ~= nil"
+                        )
                         if self.nvim
-                        else 0,
+                        else False,
                     ),
                     timeout=2.0,
                 )
@@ -390,9 +493,10 @@ end
         if self.nvim:
             try:
                 # Run quit command in executor
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 await loop.run_in_executor(
-                    None, lambda: self.nvim.command("qa!") if self.nvim else None
+                    self._rpc_executor,
+                    lambda: self.nvim.command("qa!") if self.nvim else None,
                 )
             except Exception:
                 pass
@@ -400,12 +504,21 @@ end
             # Close the Neovim connection
             try:
                 if hasattr(self.nvim, "close"):
-                    await loop.run_in_executor(None, self.nvim.close)
+                    await loop.run_in_executor(self._rpc_executor, self.nvim.close)
             except Exception:
                 pass
 
             self.nvim = None
 
+        if self._nvim_slow:
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._slow_executor, self._nvim_slow.close
+                )
+            except Exception:
+                pass
+            self._nvim_slow = None
+
         if self._process:
             try:
                 self._process.terminate()
@@ -426,13 +539,46 @@ end
 
         self._started = False
         self._buffers.clear()
+        self._symbols_cache.clear()
+        self._buffer_mtimes.clear()
+        self._path_cache.clear()
+        self._lsp_attached.clear()
+        self._lsp_cache.clear()
+
+        # Release the RPC thread; the replacement only starts a thread when the
+        # client is started again
+        self._rpc_executor.shutdown(wait=False)
+        self._rpc_executor = _new_rpc_executor()
+        self._slow_executor.shutdown(wait=False)
+        self._slow_executor = _new_rpc_executor()
+
+    def _resolve_path(self, filepath: str) -> Path:
+        """Resolve a path (relative to the project root) to an absolute path.
+
+        Results are memoized per input string: resolve() walks every path
+        component with lstat/readlink, and the same files are resolved on
+        every call.
+        """
+        file_path = self._path_cache.get(filepath)
+        if file_path is None:
+            if os.path.isabs(filepath):
+                file_path = Path(filepath).resolve()
+            else:
+                file_path = (self.project_path / filepath).resolve()
+            self._path_cache[filepath] = file_path
+        return file_path
 
-    async def open_file(self, filepath: str, create_if_missing: bool = False) -> int:
+    async def open_file(
+        self, filepath: str, create_if_missing: bool = False, wait_for_lsp: bool = True
+    ) -> int:
         """Open a file in a Neovim buffer.
 
         Args:
             filepath: Path to the file (relative to project root or absolute)
             create_if_missing: If True, create a new buffer even if file doesn't exist
+            wait_for_lsp: Give LSP clients a moment to attach after a fresh open.
+                Callers that only read or edit lines (or use TreeSitter) pass
+                False and skip the delay.
 
         Returns:
             Buffer number
@@ -440,13 +586,7 @@ end
         if not self._started:
             raise RuntimeError("Neovim not started. Call start() first.")
 
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if already open (check this BEFORE checking if file exists)
@@ -467,25 +607,152 @@ end
                 raise RuntimeError("Neovim not connected")
 
             # Run file opening in executor
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             def _open_file():
-                if not self.nvim:
-                    raise RuntimeError("Neovim not connected")
-                # 'edit' command works for both existing and new files
-                self.nvim.command(f"edit {filepath_str}")
-                return self.nvim.current.buffer.number
+                # 'edit' command works for both existing and new files; read
+                # the new current buffer in the same round-trip
+                _, buffer = self._call_atomic(
+                    [
+                        ["nvim_command", [f"edit {filepath_str}"]],
+                        ["nvim_get_current_buf", []],
+                    ]
+                )
+                return buffer.number
 
-            buf_num = await loop.run_in_executor(None, _open_file)
+            buf_num = await loop.run_in_executor(self._rpc_executor, _open_file)
             self._buffers[filepath_str] = buf_num
+            self._buffer_mtimes[filepath_str] = _disk_mtime(filepath_str)
 
-            # Give LSP time to attach
-            await asyncio.sleep(0.1)
+            # Give LSP time to attach (returns early once a client is ready)
+            if wait_for_lsp:
+                await self._wait_for_lsp_attach(buf_num, timeout=0.1)
 
             return buf_num
         except Exception as e:
             raise RuntimeError(f"Failed to open file {filepath}: {e}")
 
+    async def open_files(self, filepaths: List[str]) -> Dict[str, int]:
+        """Open several existing files in one RPC round-trip (nvim_call_atomic).
+
+        Used to prewarm LSP servers: each `edit` sends a didOpen, so the
+        servers start indexing before the first tool call needs them.
+
+        Args:
+            filepaths: Paths to open (relative to project root or absolute)
+
+        Returns:
+            Mapping of resolved file path to buffer number for the files
+            opened by this call (already-open and missing files are skipped)
+        """
+        if not self._started:
+            raise RuntimeError("Neovim not started. Call start() first.")
+
+        if not self.nvim:
+            raise RuntimeError("Neovim not connected")
+
+        to_open: List[str] = []
+        for filepath in filepaths:
+            filepath_str = str(self._resolve_path(filepath))
+            if filepath_str not in self._buffers and os.path.isfile(filepath_str):
+                to_open.append(filepath_str)
+
+        def _open_files() -> Dict[str, int]:
+            if not self.nvim:
+                raise RuntimeError("Neovim not connected")
+            opened: Dict[str, int] = {}
+            pending = to_open
+            while pending:
+                # One `edit` + current-buffer pair per file, all in one request
+                calls: List[List[Any]] = []
+                for filepath_str in pending:
+                    calls.append(["nvim_command", [f"edit {filepath_str}"]])
+                    calls.append(["nvim_get_current_buf", []])
+                results, error = self.nvim.api.call_atomic(calls)
+                for filepath_str, buffer in zip(pending, results[1::2]):
+                    opened[filepath_str] = buffer.number
+                if not error:
+                    break
+                # Calls after a failing one are not run: skip the file Neovim
+                # refused to open (warming is best-effort) and send the rest
+                pending = pending[error[0] // 2 + 1 :]
+            return opened
+
+        if to_open:
+            loop = asyncio.get_running_loop()
+            opened = await loop.run_in_executor(self._rpc_executor, _open_files)
+            self._buffers.update(opened)
+            for path in opened:
+                self._buffer_mtimes[path] = _disk_mtime(path)
+
+        return {path: self._buffers[path] for path in to_open if path in self._buffers}
+
+    def _call_atomic(self, calls: List[List[Any]]) -> List[Any]:
+        """Run several API calls in a single RPC round-trip (nvim_call_atomic).
+
+        Must run on the RPC executor. Calls after a failing one are not run.
+
+        Args:
+            calls: [method, args] pairs, e.g. ["nvim_buf_line_count", [bufnr]]
+
+        Returns:
+            One result per call
+
+        Raises:
+            RuntimeError: If any call fails (with Neovim's error message)
+        """
+        if not self.nvim:
+            raise RuntimeError("Neovim not connected")
+
+        results, error = self.nvim.api.call_atomic(calls)
+        if error:
+            index, _, message = error
+            raise RuntimeError(f"{calls[index][0]} failed: {message}")
+        return results
+
+    def _get_lines(self, buf_num: int, start: int = 0, end: int = -1) -> List[str]:
+        """Get lines [start, end) of a buffer (runs on the RPC executor).
+
+        Buffer numbers are valid API handles, so this is a single request - no
+        fetch-and-scan of the buffer list to find a Buffer object first.
+
+        Raises:
+            RuntimeError: If the buffer no longer exists
+        """
+        if not self.nvim:
+            raise RuntimeError("Neovim not connected")
+        try:
+            return self.nvim.api.buf_get_lines(buf_num, start, end, False)
+        except pynvim.NvimError as e:
+            raise RuntimeError(f"Buffer {buf_num} not found: {e}")
+
+    def _buffer_command(self, buf_num: int, command: str) -> bool:
+        """Run an Ex command in a buffer and return its 'modified' flag.
+
+        nvim_buf_call runs the command in the buffer's context without making
+        it the current buffer. Must run on the RPC executor; raises
+        pynvim.NvimError if the command fails.
+        """
+        if not self.nvim:
+            raise RuntimeError("Neovim not connected")
+        return self.nvim.exec_lua(
+            """
+            local bufnr, command = ...
+            vim.api.nvim_buf_call(bufnr, function()
+                vim.cmd(command)
+            end)
+            return vim.bo[bufnr].modified
+            """,
+            buf_num,
+            command,
+        )
+
+    def _buffer_modified(self, buf_num: int) -> bool:
+        """Whether a buffer has unsaved changes (runs on the RPC executor)."""
+        if not self.nvim:
+            raise RuntimeError("Neovim not connected")
+        return self.nvim.api.get_option_value("modified", {"buf": buf_num})
+
     async def read_buffer(
         self, filepath: str, line_range: Optional[Tuple[int, int]] = None
     ) -> List[str]:
@@ -498,37 +765,24 @@ end
         Returns:
             List of lines from the buffer
         """
-        buf_num = await self.open_file(filepath)
+        buf_num = await self.open_file(filepath, wait_for_lsp=False)
 
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
         # Get buffer contents in executor
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _read_buffer():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Get the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
-
             # Get lines
             if line_range:
                 start, end = line_range
                 # Neovim uses 0-indexed lines
-                return buf[start - 1 : end]
+                return self._get_lines(buf_num, start - 1, end)
             else:
-                return buf[:]
+                return self._get_lines(buf_num)
 
-        lines = await loop.run_in_executor(None, _read_buffer)
+        lines = await loop.run_in_executor(self._rpc_executor, _read_buffer)
         return lines
 
     async def get_buffer_info(self, filepath: str) -> Dict[str, Any]:
@@ -544,13 +798,7 @@ end
             - line_count: Number of lines in the buffer
             - language: File type/language
         """
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if file is in our buffers cache
@@ -559,9 +807,7 @@ end
         if not is_open:
             # File not open, return basic info
             if file_path.exists():
-                with open(file_path, "r") as f:
-                    lines = f.readlines()
-                line_count = len(lines)
+                line_count = _count_lines(file_path)
             else:
                 line_count = 0
 
@@ -580,26 +826,17 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _get_info():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
-
-            # Get buffer info
-            is_modified = buf.options.get("modified", False)
-            line_count = len(buf)
-            filetype = buf.options.get("filetype", "unknown")
+            # Get buffer info (one round-trip)
+            is_modified, line_count, filetype = self._call_atomic(
+                [
+                    ["nvim_get_option_value", ["modified", {"buf": buf_num}]],
+                    ["nvim_buf_line_count", [buf_num]],
+                    ["nvim_get_option_value", ["filetype", {"buf": buf_num}]],
+                ]
+            )
 
             return {
                 "is_open": True,
@@ -608,7 +845,7 @@ end
                 "language": filetype,
             }
 
-        info = await loop.run_in_executor(None, _get_info)
+        info = await loop.run_in_executor(self._rpc_executor, _get_info)
         return info
 
     async def edit_buffer_lines(
@@ -630,31 +867,22 @@ end
             - is_modified: Whether buffer is now modified
         """
         # Open file if not already open
-        buf_num = await self.open_file(filepath)
+        buf_num = await self.open_file(filepath, wait_for_lsp=False)
 
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _apply_edits():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
+            (buf_len,) = self._call_atomic([["nvim_buf_line_count", [buf_num]]])
 
             # Sort edits by line number (descending) to avoid offset issues
             sorted_edits = sorted(edits, key=lambda e: e[0], reverse=True)
 
-            # Apply each edit
+            # Validate every edit against the line count it will see, then
+            # send all of them in one round-trip
+            calls: List[List[Any]] = []
             for start_line, end_line, new_lines in sorted_edits:
                 # Convert to 0-indexed
                 start_idx = start_line - 1
@@ -663,17 +891,24 @@ end
                 # Validate line range
                 if start_idx < 0:
                     raise ValueError(f"Invalid start line: {start_line} (must be >= 1)")
-                if end_idx > len(buf):
+                if end_idx > buf_len:
                     raise ValueError(
-                        f"Invalid end line: {end_line} (buffer has {len(buf)} lines)"
+                        f"Invalid end line: {end_line} (buffer has {buf_len} lines)"
                     )
 
                 # Set lines in buffer
-                buf[start_idx:end_idx] = new_lines
+                calls.append(
+                    [
+                        "nvim_buf_set_lines",
+                        [buf_num, start_idx, end_idx, True, new_lines],
+                    ]
+                )
+                buf_len += len(new_lines) - (end_idx - start_idx)
 
             # Get updated buffer info
-            is_modified = buf.options.get("modified", False)
-            line_count = len(buf)
+            calls.append(["nvim_get_option_value", ["modified", {"buf": buf_num}]])
+            calls.append(["nvim_buf_line_count", [buf_num]])
+            *_, is_modified, line_count = self._call_atomic(calls)
 
             return {
                 "success": True,
@@ -681,7 +916,7 @@ end
                 "is_modified": is_modified,
             }
 
-        result = await loop.run_in_executor(None, _apply_edits)
+        result = await loop.run_in_executor(self._rpc_executor, _apply_edits)
         return result
 
     async def save_buffer(self, filepath: str) -> Dict[str, Any]:
@@ -696,13 +931,7 @@ end
             - is_modified: Whether buffer is still modified (should be False after save)
             - file: Absolute path to saved file
         """
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if file is open
@@ -720,30 +949,15 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _save_buffer():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
-
             # Execute write command for this buffer
             # Use :write to save the buffer
             try:
-                self.nvim.command(f"buffer {buf_num}")
-                self.nvim.command("write")
-
-                # Check if buffer is still modified (should be False after save)
-                is_modified = buf.options.get("modified", False)
+                # Write and check if buffer is still modified (should be False
+                # after save) in one round-trip
+                is_modified = self._buffer_command(buf_num, "write")
 
                 return {
                     "success": True,
@@ -753,12 +967,14 @@ end
             except Exception as e:
                 return {
                     "success": False,
-                    "is_modified": buf.options.get("modified", False),
+                    "is_modified": self._buffer_modified(buf_num),
                     "file": filepath_str,
                     "error": str(e),
                 }
 
-        result = await loop.run_in_executor(None, _save_buffer)
+        result = await loop.run_in_executor(self._rpc_executor, _save_buffer)
+        if result["success"]:
+            self._buffer_mtimes[filepath_str] = _disk_mtime(filepath_str)
         return result
 
     async def discard_buffer(self, filepath: str) -> Dict[str, Any]:
@@ -773,13 +989,7 @@ end
             - is_modified: Whether buffer is still modified (should be False after discard)
             - file: Absolute path to file
         """
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if file is open
@@ -796,29 +1006,14 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _discard_buffer():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
-
             # Reload buffer from disk using :edit!
             try:
-                self.nvim.command(f"buffer {buf_num}")
-                self.nvim.command("edit!")  # Force reload from disk
-
-                # Check modified status (should be False after reload)
-                is_modified = buf.options.get("modified", False)
+                # Force reload from disk and check modified status (should be
+                # False after reload) in one round-trip
+                is_modified = self._buffer_command(buf_num, "edit!")
 
                 return {
                     "success": True,
@@ -828,12 +1023,14 @@ end
             except Exception as e:
                 return {
                     "success": False,
-                    "is_modified": buf.options.get("modified", False),
+                    "is_modified": self._buffer_modified(buf_num),
                     "file": filepath_str,
                     "error": str(e),
                 }
 
-        result = await loop.run_in_executor(None, _discard_buffer)
+        result = await loop.run_in_executor(self._rpc_executor, _discard_buffer)
+        if result["success"]:
+            self._buffer_mtimes[filepath_str] = _disk_mtime(filepath_str)
         return result
 
     async def get_buffer_content(self, filepath: str) -> Optional[str]:
@@ -845,13 +1042,7 @@ end
         Returns:
             Buffer content as string, or None if buffer not open
         """
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if file is open
@@ -863,27 +1054,23 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _get_content():
+            # Join the lines inside Neovim: one string crosses the socket
+            # instead of one msgpack string per line
             if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
+                return None
+            try:
+                return self.nvim.exec_lua(
+                    "return table.concat("
+                    "vim.api.nvim_buf_get_lines(..., 0, -1, false), '\\n')",
+                    buf_num,
+                )
+            except pynvim.NvimError:
                 return None
 
-            # Get buffer lines and join
-            lines = buf[:]
-            return "\n".join(lines)
-
-        return await loop.run_in_executor(None, _get_content)
+        return await loop.run_in_executor(self._rpc_executor, _get_content)
 
     async def get_buffer_diff(self, filepath: str) -> Dict[str, Any]:
         """Get diff between buffer and disk version.
@@ -897,13 +1084,7 @@ end
             - diff: Unified diff string (if has_changes)
             - file: Absolute path to file
         """
-        # Resolve path
-        if os.path.isabs(filepath):
-            file_path = Path(filepath)
-        else:
-            file_path = self.project_path / filepath
-
-        file_path = file_path.resolve()
+        file_path = self._resolve_path(filepath)
         filepath_str = str(file_path)
 
         # Check if file is open
@@ -919,80 +1100,84 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
-        loop = asyncio.get_event_loop()
-
-        def _get_diff():
-            if not self.nvim:
-                raise RuntimeError("Neovim not connected")
-
-            # Find the buffer
-            buf = None
-            for b in self.nvim.buffers:
-                if b.number == buf_num:
-                    buf = b
-                    break
-
-            if not buf:
-                raise RuntimeError(f"Buffer {buf_num} not found")
-
-            try:
-                # Get buffer content
-                buffer_lines = buf[:]
-
-                # Read disk content
-                if not file_path.exists():
-                    # New file not yet saved
-                    import difflib
-
-                    diff = difflib.unified_diff(
-                        [],
-                        buffer_lines,
-                        fromfile=f"a/{filepath_str}",
-                        tofile=f"b/{filepath_str}",
-                        lineterm="",
-                    )
-                    return {
-                        "has_changes": True,
-                        "diff": "\n".join(diff),
-                        "file": filepath_str,
-                    }
+        # An unmodified buffer whose file hasn't changed since it was loaded
+        # or saved has no diff; Neovim then skips reading the file
+        mtime = _disk_mtime(filepath_str)
+        unchanged_on_disk = (
+            mtime is not None and self._buffer_mtimes.get(filepath_str) == mtime
+        )
 
-                with open(file_path, "r") as f:
-                    disk_lines = f.read().splitlines()
+        # Read the file and diff inside Neovim (xdiff), so only the diff text
+        # crosses the socket rather than every buffer line
+        lua_code = """
+        local bufnr, path, unchanged_on_disk = ...
+        if unchanged_on_disk and not vim.bo[bufnr].modified then
+            return { has_changes = false }
+        end
 
-                # Compare
-                if buffer_lines == disk_lines:
-                    return {"has_changes": False, "file": filepath_str}
+        local lines = vim.api.nvim_buf_get_lines(bufnr, 0, -1, false)
+        local buffer = table.concat(lines, "\\n") .. "\\n"
 
-                # Generate unified diff
-                import difflib
+        local disk = ""
+        if (vim.uv or vim.loop).fs_stat(path) then
+            local f, err = io.open(path, "rb")
+            if not f then
+                return { error = err }
+            end
+            disk = f:read("*a"):gsub("\\r\\n", "\\n")
+            f:close()
+            if disk ~= "" and disk:sub(-1) ~= "\\n" then
+                disk = disk .. "\\n"
+            end
+        end
 
-                diff = difflib.unified_diff(
-                    disk_lines,
-                    buffer_lines,
-                    fromfile=f"a/{filepath_str}",
-                    tofile=f"b/{filepath_str}",
-                    lineterm="",
-                )
+        if disk == buffer then
+            return { has_changes = false }
+        end
+        local diff = (vim.text and vim.text.diff or vim.diff)(disk, buffer, {
+            result_type = "unified",
+            ctxlen = 3,
+        })
+        return { has_changes = true, diff = diff }
+        """
 
-                return {
-                    "has_changes": True,
-                    "diff": "\n".join(diff),
-                    "file": filepath_str,
-                }
+        try:
+            result = await self.execute_lua(
+                lua_code, buf_num, filepath_str, unchanged_on_disk
+            )
+        except RuntimeError as e:
+            return {"has_changes": False, "file": filepath_str, "error": str(e)}
 
-            except Exception as e:
-                return {"has_changes": False, "file": filepath_str, "error": str(e)}
+        if result.get("error"):
+            error = result["error"]
+            return {"has_changes": False, "file": filepath_str, "error": error}
+        if not result["has_changes"]:
+            return {"has_changes": False, "file": filepath_str}
 
-        result = await loop.run_in_executor(None, _get_diff)
-        return result
+        # xdiff emits only the hunks; keep the ---/+++ file header
+        diff = f"--- a/{filepath_str}\n+++ b/{filepath_str}\n" + result["diff"]
+        return {
+            "has_changes": True,
+            "diff": diff.rstrip("\n"),
+            "file": filepath_str,
+        }
 
-    async def execute_lua(self, lua_code: str, *args: Any) -> Any:
+    async def execute_lua(
+        self,
+        lua_code: str,
+        *args: Any,
+        priority: Literal["fast", "slow"] = "fast",
+        stamped: bool = False,
+    ) -> Any:
         """Execute Lua code in Neovim.
 
         Args:
             lua_code: Lua code to execute
             *args: Arguments to pass to the Lua code (accessed via ... in Lua)
+            priority: "slow" runs the code on the second connection, for
+                requests that may block for seconds (rename, references)
+            stamped: Return (buffers stamp, result), with the stamp taken in
+                the same request just before the code runs
 
         Returns:
             Result from Lua execution
@@ -1003,13 +1188,22 @@ end
         if not self.nvim:
             raise RuntimeError("Neovim not connected")
 
+        nvim, executor = self.nvim, self._rpc_executor
+        if priority == "slow" and self._nvim_slow:
+            nvim, executor = self._nvim_slow, self._slow_executor
+
         # Run Lua execution in executor
-        # Convert args tuple to list (pynvim expects a list)
-        loop = asyncio.get_event_loop()
+        # Arguments are passed through as-is and arrive as `...` in the chunk
+        loop = asyncio.get_running_loop()
         try:
+            if stamped:
+                result = await loop.run_in_executor(
+                    executor,
+                    lambda: nvim.exec_lua(_STAMPED_CALL_LUA, lua_code, list(args)),
+                )
+                return tuple(result["stamp"]), result.get("result")
             result = await loop.run_in_executor(
-                None,
-                lambda: self.nvim.exec_lua(lua_code, list(args)) if self.nvim else None,
+                executor, lambda: nvim.exec_lua(lua_code, *args)
             )
             return result
         except Exception as e:
@@ -1026,19 +1220,93 @@ end
         """
         buf_num = await self.open_file(filepath)
 
-        lua_code = f"""
-        local bufnr = {buf_num}
+        lua_code = """
+        local bufnr = ...
         local diagnostics = vim.diagnostic.get(bufnr)
         return diagnostics
         """
 
         try:
-            diagnostics = await self.execute_lua(lua_code)
+            diagnostics = await self.execute_lua(lua_code, buf_num)
             return diagnostics or []
         except Exception:
             # Diagnostics not available
             return []
 
+    async def _wait_for_lsp_attach(self, buf_num: int, timeout: float = 0.5) -> None:
+        """Wait for an initialized LSP client on a buffer, up to `timeout`.
+
+        Neovim does the waiting (vim.wait), so this returns as soon as a
+        client is ready. Once a buffer has had a client, later calls for it
+        return without a round-trip.
+        """
+        if buf_num in self._lsp_attached:
+            return
+        try:
+            attached = await self.execute_lua(
+                """
+                local bufnr, timeout_ms = ...
+                return vim.wait(timeout_ms, function()
+                    for _, client in ipairs(vim.lsp.get_clients({ bufnr = bufnr })) do
+                        if client.initialized then
+                            return true
+                        end
+                    end
+                    return false
+                end, 10)
+                """,
+                buf_num,
+                int(timeout * 1000),
+            )
+        except RuntimeError:
+            # The LSP request that follows reports the failure
+            return
+        if attached:
+            self._lsp_attached.add(buf_num)
+
+    async def _buffers_stamp(self) -> Optional[Tuple[int, int]]:
+        """Snapshot of all loaded buffers' changedticks (None if unavailable).
+
+        Any edit to any buffer (including workspace edits applied in Lua)
+        changes it, so it keys LSP results whose answer can depend on other
+        files too.
+        """
+        try:
+            total, count = await self.execute_lua(_BUFFERS_STAMP_LUA)
+        except RuntimeError:
+            return None
+        return total, count
+
+    async def _cached_lsp_result(self, key: Tuple[Any, ...]) -> Any:
+        """Return the cached LSP result for key if nothing it depends on changed.
+
+        A result is reused while no loaded buffer was edited and none of the
+        files it points into changed on disk (a checkout or formatter can
+        rewrite files that were never loaded). The buffers stamp is only
+        fetched when there is an entry to check.
+        """
+        entry = self._lsp_cache.get(key)
+        if entry is None:
+            return None
+        stamp, files, result = entry
+        if all(_disk_mtime(path) == mtime for path, mtime in files):
+            if await self._buffers_stamp() == stamp:
+                return result
+        self._lsp_cache.pop(key, None)
+        return None
+
+    def _cache_lsp_result(
+        self, key: Tuple[Any, ...], stamp: Optional[Tuple[int, int]], result: Any
+    ) -> None:
+        """Store an LSP result, evicting the oldest entry when full."""
+        if result is None or stamp is None:
+            # Don't pin a miss: the server may just not be ready yet
+            return
+        self._lsp_cache.pop(key, None)
+        if len(self._lsp_cache) >= _LSP_CACHE_SIZE:
+            del self._lsp_cache[next(iter(self._lsp_cache))]
+        self._lsp_cache[key] = (stamp, _location_mtimes(result), result)
+
     async def lsp_definition(
         self, filepath: str, line: int, column: int
     ) -> Optional[List[Dict[str, Any]]]:
@@ -1054,18 +1322,31 @@ end
         """
         buf_num = await self.open_file(filepath)
 
+        # Same position, nothing edited since: reuse the last answer
+        key = ("textDocument/definition", buf_num, line, column)
+        cached = await self._cached_lsp_result(key)
+        if cached is not None:
+            return cached
+
         # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
+        await self._wait_for_lsp_attach(buf_num)
 
         # Use pynvim to call Lua helper (LSP is Lua-native in Neovim)
         # We still need Lua because vim.lsp.* is a Lua API, not exposed via pynvim
         try:
-            result = await self._lsp_request(
-                buf_num, "textDocument/definition", line - 1, column
+            stamp, result = await self._lsp_request(
+                buf_num,
+                "textDocument/definition",
+                line - 1,
+                column,
+                self.config.lsp.timeout_ms,
+                first_only=True,
             )
-            return result if result else None
         except Exception:
             return None
+        result = result if result else None
+        self._cache_lsp_result(key, stamp, result)
+        return result
 
     async def lsp_references(
         self, filepath: str, line: int, column: int, include_declaration: bool = True
@@ -1083,8 +1364,11 @@ end
         """
         buf_num = await self.open_file(filepath)
 
+        # Not cached: a new call site written to any file on disk changes the
+        # answer, and nothing short of a project-wide scan would notice
+
         # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
+        await self._wait_for_lsp_attach(buf_num)
 
         try:
             # textDocument/references needs a special context parameter
@@ -1094,6 +1378,7 @@ end
                 line - 1,
                 column,
                 include_declaration,
+                self.config.lsp.timeout_ms,
             )
             return result if result else None
         except Exception:
@@ -1104,6 +1389,10 @@ end
     ) -> Optional[List[Dict[str, Any]]]:
         """Get document symbols (outline) for a file.
 
+        Results are cached per buffer and reused until the buffer changes
+        (its changedtick moves), so get_symbols, find_definition and friends
+        on the same file share one LSP request.
+
         Args:
             filepath: Path to the file
 
@@ -1112,34 +1401,40 @@ end
         """
         buf_num = await self.open_file(filepath)
 
-        # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
+        cached = self._symbols_cache.get(buf_num)
+        if cached is None:
+            # Wait for LSP to attach and be ready
+            await self._wait_for_lsp_attach(buf_num)
 
-        lua_code = f"""
-        local bufnr = {buf_num}
+        lua_code = """
+        local bufnr, cached_tick, timeout = ...
+        local tick = vim.b[bufnr].changedtick
+        if tick == cached_tick then
+            return { tick = tick, cached = true }
+        end
         
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
             return nil
         end
         
         -- Build params for document symbols
-        local params = {{
+        local params = {
             textDocument = vim.lsp.util.make_text_document_params(bufnr)
-        }}
+        }
         
         -- Synchronous request
-        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/documentSymbol', params, 2000)
+        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/documentSymbol', params, timeout)
         
-        if not result or vim.tbl_isempty(result) then
+        if not result or next(result) == nil then
             return nil
         end
         
         -- Collect symbols from all LSP clients (usually just one responds)
         for _, response in pairs(result) do
             if response.result and type(response.result) == 'table' and #response.result > 0 then
-                return response.result
+                return { tick = tick, symbols = response.result }
             end
         end
         
@@ -1147,10 +1442,23 @@ end
         """
 
         try:
-            result = await self.execute_lua(lua_code)
-            return result if result else None
+            result = await self.execute_lua(
+                lua_code,
+                buf_num,
+                cached[0] if cached is not None else None,
+                self.config.lsp.timeout_ms,
+            )
         except Exception:
             return None
+        if not result:
+            return None
+        if result.get("cached") and cached is not None:
+            return cached[1]
+        symbols = result.get("symbols")
+        if not symbols:
+            return None
+        self._symbols_cache[buf_num] = (result["tick"], symbols)
+        return symbols
 
     async def lsp_hover(
         self, filepath: str, line: int, column: int
@@ -1167,48 +1475,92 @@ end
         """
         buf_num = await self.open_file(filepath)
 
+        # Same position, nothing edited since: reuse the last answer
+        key = ("textDocument/hover", buf_num, line, column)
+        cached = await self._cached_lsp_result(key)
+        if cached is not None:
+            return cached
+
+        stamp, results = await self._lsp_hover_batch(filepath, [(line, column)])
+        self._cache_lsp_result(key, stamp, results[0])
+        return results[0]
+
+    async def lsp_hover_batch(
+        self, filepath: str, positions: List[Tuple[int, int]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get hover information for several positions in one round-trip.
+
+        All hover requests are sent to the LSP server at once and awaited
+        together in a single Lua call, so N positions cost one RPC and
+        roughly the latency of the slowest request.
+
+        Args:
+            filepath: Path to the file
+            positions: (line, column) pairs (1-indexed line, 0-indexed column)
+
+        Returns:
+            Hover information per position (None where nothing was found)
+        """
+        _, results = await self._lsp_hover_batch(filepath, positions)
+        return results
+
+    async def _lsp_hover_batch(
+        self, filepath: str, positions: List[Tuple[int, int]]
+    ) -> Tuple[Optional[Tuple[int, int]], List[Optional[Dict[str, Any]]]]:
+        """lsp_hover_batch(), also returning the buffers stamp of the request."""
+        buf_num = await self.open_file(filepath)
+
         # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
+        await self._wait_for_lsp_attach(buf_num)
+
+        lua_code = """
+        local bufnr, positions, timeout = ...
 
-        lua_code = f"""
-        local bufnr = {buf_num}
-        local line = {line - 1}  -- Convert to 0-indexed
-        local col = {column}
-        
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
             return nil
         end
-        
-        -- Build params
-        local params = {{
-            textDocument = vim.lsp.util.make_text_document_params(bufnr),
-            position = {{ line = line, character = col }}
-        }}
-        
-        -- Synchronous request
-        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/hover', params, 2000)
-        
-        if not result or vim.tbl_isempty(result) then
-            return nil
+
+        local results = {}
+        local pending = #positions
+        for i, pos in ipairs(positions) do
+            local params = {
+                textDocument = vim.lsp.util.make_text_document_params(bufnr),
+                position = { line = pos[1], character = pos[2] }
+            }
+            vim.lsp.buf_request_all(bufnr, 'textDocument/hover', params, function(responses)
+                -- Keep the hover result from the first responding client
+                for _, response in pairs(responses) do
+                    if response.result then
+                        results[i] = response.result
+                        break
+                    end
+                end
+                pending = pending - 1
+            end)
         end
-        
-        -- Extract hover result from first responding client
-        for _, response in pairs(result) do
-            if response.result then
-                return response.result
-            end
+        vim.wait(timeout, function() return pending == 0 end, 10)
+
+        -- Dense list: nil holes would cut the array short
+        local out = {}
+        for i = 1, #positions do
+            out[i] = results[i] or vim.NIL
         end
-        
-        return nil
+        return out
         """
 
+        # Convert lines to 0-indexed
+        params = [[line - 1, column] for line, column in positions]
         try:
-            result = await self.execute_lua(lua_code)
-            return result if result else None
+            stamp, results = await self.execute_lua(
+                lua_code, buf_num, params, self.config.lsp.timeout_ms, stamped=True
+            )
         except Exception:
-            return None
+            return None, [None] * len(positions)
+        if not results:
+            return stamp, [None] * len(positions)
+        return stamp, [result if result else None for result in results]
 
     async def lsp_completion(
         self, filepath: str, line: int, column: int
@@ -1225,33 +1577,37 @@ end
         """
         buf_num = await self.open_file(filepath)
 
+        # Same position, nothing edited since: reuse the last answer
+        key = ("textDocument/completion", buf_num, line, column)
+        cached = await self._cached_lsp_result(key)
+        if cached is not None:
+            return cached
+
         # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
+        await self._wait_for_lsp_attach(buf_num)
 
-        lua_code = f"""
-        local bufnr = {buf_num}
-        local line = {line - 1}  -- Convert to 0-indexed
-        local col = {column}
+        lua_code = """
+        local bufnr, line, col, timeout = ...
         
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
             return nil
         end
         
         -- Build params
-        local params = {{
+        local params = {
             textDocument = vim.lsp.util.make_text_document_params(bufnr),
-            position = {{ line = line, character = col }},
-            context = {{
+            position = { line = line, character = col },
+            context = {
                 triggerKind = 1  -- Invoked (1 = invoked, 2 = trigger character, 3 = reopen)
-            }}
-        }}
+            }
+        }
         
         -- Synchronous request
-        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/completion', params, 3000)
+        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/completion', params, timeout)
         
-        if not result or vim.tbl_isempty(result) then
+        if not result or next(result) == nil then
             return nil
         end
         
@@ -1273,10 +1629,20 @@ end
         """
 
         try:
-            result = await self.execute_lua(lua_code)
-            return result if result else None
+            # Lines are 0-indexed on the LSP side
+            stamp, result = await self.execute_lua(
+                lua_code,
+                buf_num,
+                line - 1,
+                column,
+                self.config.lsp.completion_timeout_ms,
+                stamped=True,
+            )
         except Exception:
             return None
+        result = result if result else None
+        self._cache_lsp_result(key, stamp, result)
+        return result
 
     async def lsp_rename(
         self, filepath: str, line: int, column: int, new_name: str
@@ -1295,35 +1661,29 @@ end
         buf_num = await self.open_file(filepath)
 
         # Wait for LSP to attach and be ready
-        await asyncio.sleep(0.5)
-
-        # Escape special characters in new_name for Lua string
-        new_name_escaped = new_name.replace("\\", "\\\\").replace("'", "\\'")
+        await self._wait_for_lsp_attach(buf_num)
 
-        lua_code = f"""
-        local bufnr = {buf_num}
-        local line = {line - 1}  -- Convert to 0-indexed
-        local col = {column}
-        local new_name = '{new_name_escaped}'
+        lua_code = """
+        local bufnr, line, col, new_name, timeout = ...
         
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
-            return {{ error = 'No LSP clients attached' }}
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
+            return { error = 'No LSP clients attached' }
         end
         
         -- Build rename params
-        local params = {{
+        local params = {
             textDocument = vim.lsp.util.make_text_document_params(bufnr),
-            position = {{ line = line, character = col }},
+            position = { line = line, character = col },
             newName = new_name
-        }}
+        }
         
         -- Synchronous request
-        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/rename', params, 5000)
+        local result = vim.lsp.buf_request_sync(bufnr, 'textDocument/rename', params, timeout)
         
-        if not result or vim.tbl_isempty(result) then
-            return {{ error = 'No rename results from LSP' }}
+        if not result or next(result) == nil then
+            return { error = 'No rename results from LSP' }
         end
         
         -- Collect WorkspaceEdit from first successful response
@@ -1332,15 +1692,25 @@ end
                 return response.result
             end
             if response.error then
-                return {{ error = response.error.message or 'Rename failed' }}
+                return { error = response.error.message or 'Rename failed' }
             end
         end
         
-        return {{ error = 'LSP rename request failed' }}
+        return { error = 'LSP rename request failed' }
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            # Lines are 0-indexed on the LSP side; new_name is passed as a
+            # value, so quotes and backslashes need no escaping
+            result = await self.execute_lua(
+                lua_code,
+                buf_num,
+                line - 1,
+                column,
+                new_name,
+                self.config.lsp.rename_timeout_ms,
+                priority="slow",
+            )
             if result and isinstance(result, dict) and "error" in result:
                 return None
             return result if result else None
@@ -1348,42 +1718,55 @@ end
             return None
 
     async def _lsp_request(
-        self, bufnr: int, method: str, line: int, column: int, timeout_ms: int = 2000
-    ) -> Optional[List[Dict[str, Any]]]:
+        self,
+        bufnr: int,
+        method: str,
+        line: int,
+        column: int,
+        timeout_ms: int = 2000,
+        first_only: bool = False,
+    ) -> Tuple[Tuple[int, int], Optional[List[Dict[str, Any]]]]:
         """Generic LSP request helper.
 
+        With ``first_only`` the first location found is returned on its own,
+        without collecting the rest. Returns (buffers stamp, locations).
+
         Note: We use Lua because Neovim's LSP client (vim.lsp.*) is Lua-native.
         pynvim doesn't provide direct LSP bindings, so Lua is the right layer.
         """
-        # Use f-strings for now - simpler and more reliable than varargs
-        lua_code = f"""
-        local bufnr = {bufnr}
-        local method = '{method}'
-        local line = {line}
-        local col = {column}
-        local timeout = {timeout_ms}
+        lua_code = """
+        local bufnr, method, line, col, timeout, first_only = ...
         
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
             return nil
         end
         
         -- Build params
-        local params = {{
+        local params = {
             textDocument = vim.lsp.util.make_text_document_params(bufnr),
-            position = {{ line = line, character = col }}
-        }}
+            position = { line = line, character = col }
+        }
         
         -- Synchronous request
         local result = vim.lsp.buf_request_sync(bufnr, method, params, timeout)
         
-        if not result or vim.tbl_isempty(result) then
+        if not result or next(result) == nil then
             return nil
         end
         
+        -- Single responding client with a location list: return it as-is
+        local client_id, only = next(result)
+        if next(result, client_id) == nil then
+            local res = only.result
+            if type(res) == 'table' and #res > 0 then
+                return first_only and { res[1] } or res
+            end
+        end
+        
         -- Collect locations from all LSP clients
-        local locations = {{}}
+        local locations = {}
         for _, response in pairs(result) do
             if response.result then
                 local res = response.result
@@ -1395,13 +1778,17 @@ end
                     end
                 end
             end
+            if first_only and #locations > 0 then
+                return { locations[1] }
+            end
         end
         
         return #locations > 0 and locations or nil
         """
 
-        result = await self.execute_lua(lua_code)
-        return result
+        return await self.execute_lua(
+            lua_code, bufnr, method, line, column, timeout_ms, first_only, stamped=True
+        )
 
     async def _lsp_request_with_context(
         self,
@@ -1416,36 +1803,40 @@ end
 
         References require a special context parameter.
         """
-        lua_code = f"""
-        local bufnr = {bufnr}
-        local method = '{method}'
-        local line = {line}
-        local col = {column}
-        local include_declaration = {"true" if include_declaration else "false"}
-        local timeout = {timeout_ms}
+        lua_code = """
+        local bufnr, method, line, col, include_declaration, timeout = ...
         
         -- Check for LSP clients
-        local clients = vim.lsp.get_clients({{ bufnr = bufnr }})
-        if #clients == 0 then
+        local clients = vim.lsp.get_clients({ bufnr = bufnr })
+        if next(clients) == nil then
             return nil
         end
         
         -- Build params with context for references
-        local params = {{
+        local params = {
             textDocument = vim.lsp.util.make_text_document_params(bufnr),
-            position = {{ line = line, character = col }},
-            context = {{ includeDeclaration = include_declaration }}
-        }}
+            position = { line = line, character = col },
+            context = { includeDeclaration = include_declaration }
+        }
         
         -- Synchronous request
         local result = vim.lsp.buf_request_sync(bufnr, method, params, timeout)
         
-        if not result or vim.tbl_isempty(result) then
+        if not result or next(result) == nil then
             return nil
         end
         
+        -- Single responding client with a location list: return it as-is
+        local client_id, only = next(result)
+        if next(result, client_id) == nil then
+            local res = only.result
+            if type(res) == 'table' and #res > 0 then
+                return res
+            end
+        end
+        
         -- Collect locations from all LSP clients
-        local locations = {{}}
+        local locations = {}
         for _, response in pairs(result) do
             if response.result then
                 local res = response.result
@@ -1462,8 +1853,16 @@ end
         return #locations > 0 and locations or nil
         """
 
-        result = await self.execute_lua(lua_code)
-        return result
+        return await self.execute_lua(
+            lua_code,
+            bufnr,
+            method,
+            line,
+            column,
+            include_declaration,
+            timeout_ms,
+            priority="slow",
+        )
 
     # ========================================================================
     # DAP (Debug Adapter Protocol) Methods
@@ -1505,15 +1904,18 @@ end
         buf_num = None
 
         if filepath:
-            buf_num = await self.open_file(filepath)
-            await asyncio.sleep(0.5)  # Wait for DAP to be ready
+            # The filetype (and any FileType-triggered DAP setup) is in place
+            # once :edit returns; DAP doesn't need the LSP client
+            buf_num = await self.open_file(filepath, wait_for_lsp=False)
 
             # Get filetype from buffer
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             try:
                 filetype = await loop.run_in_executor(
-                    None,
-                    lambda: self.nvim.eval(f'getbufvar({buf_num}, "&filetype")')
+                    self._rpc_executor,
+                    lambda: self.nvim.api.get_option_value(
+                        "filetype", {"buf": buf_num}
+                    )
                     if self.nvim
                     else "python",
                 )
@@ -1528,106 +1930,87 @@ end
                 elif filepath.endswith(".go"):
                     filetype = "go"
 
-        # Build configuration dict
-        # Escape strings for Lua
-        def lua_escape(s: str) -> str:
-            return s.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-
-        # Build args list for Lua
-        args_lua = "nil"
-        if args:
-            escaped_args = [f"'{lua_escape(arg)}'" for arg in args]
-            args_lua = "{" + ", ".join(escaped_args) + "}"
-
-        # Build env dict for Lua
-        env_lua = "nil"
-        if env:
-            env_pairs = [
-                f"['{lua_escape(k)}'] = '{lua_escape(v)}'" for k, v in env.items()
-            ]
-            env_lua = "{" + ", ".join(env_pairs) + "}"
-
-        # Build config
-        cwd_lua = f"'{lua_escape(cwd)}'" if cwd else "nil"
-        module_lua = f"'{lua_escape(module)}'" if module else "nil"
-        filepath_lua = f"'{lua_escape(filepath)}'" if filepath else "nil"
-
-        # Build breakpoints list for Lua
-        breakpoint_lines_lua = "nil"
-        if breakpoints and filepath:
-            breakpoint_lines_lua = (
-                "{" + ", ".join(str(line) for line in breakpoints) + "}"
-            )
-
-        lua_code = f"""
+        # Values reach Lua as arguments (`...`), so paths, args and env
+        # entries need no quoting or escaping. Unused ones arrive as vim.NIL
+        # (which is truthy) and are turned into nil first
+        lua_code = """
+        local filetype, user_session_id, module, filepath, args, env, cwd,
+            stop_on_entry, just_my_code, runtime_path, breakpoint_lines = ...
+        local function optional(value)
+            if value == vim.NIL then
+                return nil
+            end
+            return value
+        end
+        module, filepath, args, env, cwd, runtime_path, breakpoint_lines =
+            optional(module), optional(filepath), optional(args), optional(env),
+            optional(cwd), optional(runtime_path), optional(breakpoint_lines)
         local dap = require('dap')
-        local filetype = '{filetype}'
-        local user_session_id = '{session_id}'  -- 🔑 Session ID from Python
         
         -- Initialize session registry if needed
-        _G.otter_session_registry = _G.otter_session_registry or {{}}
+        _G.otter_session_registry = _G.otter_session_registry or {}
         
         -- Check if DAP is configured for this filetype
         -- DAP should already be set up via dap_config.setup() during initialization
         if not dap.configurations[filetype] then
             local config_status = _G.otter_runtime_config and 'loaded' or 'not loaded'
             local enabled_langs = _G.otter_runtime_config and vim.inspect(_G.otter_runtime_config.enabled_languages) or 'none'
-            return {{ error = 'No debug configuration available for filetype: ' .. filetype .. 
+            return { error = 'No debug configuration available for filetype: ' .. filetype .. 
                     '\\nRuntime config: ' .. config_status .. 
-                    '\\nEnabled languages: ' .. enabled_langs }}
+                    '\\nEnabled languages: ' .. enabled_langs }
         end
         
         -- Build custom configuration
-        local config = {{
+        local config = {
             type = filetype,
             request = 'launch',
             name = 'Otter Debug Session',
-        }}
+        }
         
         -- Set program/module
-        if {module_lua} then
-            config.module = {module_lua}
-        elseif {filepath_lua} then
-            config.program = {filepath_lua}
+        if module then
+            config.module = module
+        elseif filepath then
+            config.program = filepath
         else
-            return {{ error = 'Must specify either file or module' }}
+            return { error = 'Must specify either file or module' }
         end
         
         -- Add optional parameters
-        if {args_lua} then
-            config.args = {args_lua}
+        if args then
+            config.args = args
         end
         
-        if {env_lua} then
-            config.env = {env_lua}
+        if env then
+            config.env = env
         end
         
-        if {cwd_lua} then
-            config.cwd = {cwd_lua}
+        if cwd then
+            config.cwd = cwd
         end
         
-        config.stopOnEntry = {str(stop_on_entry).lower()}
-        config.justMyCode = {str(just_my_code).lower()}
+        config.stopOnEntry = stop_on_entry
+        config.justMyCode = just_my_code
         
         -- 🎯 CRITICAL: Set runtime path from RuntimeResolver
         -- This is used by BOTH the DAP adapter AND the debugged program
         -- Ensures unified runtime across LSP and DAP
         if filetype == 'python' then
             -- Python: Set Python interpreter path
-            {f"config.pythonPath = '{lua_escape(runtime_path)}'" if runtime_path else "config.pythonPath = vim.fn.exepath('python')"}
+            config.pythonPath = runtime_path or vim.fn.exepath('python')
         elseif filetype == 'javascript' or filetype == 'typescript' then
             -- Node.js: Set runtime executable
-            {f"config.runtimeExecutable = '{lua_escape(runtime_path)}'" if runtime_path else "config.runtimeExecutable = 'node'"}
+            config.runtimeExecutable = runtime_path or 'node'
         elseif filetype == 'rust' then
             -- Rust: Typically uses cargo
             -- Runtime path would point to cargo if specified
-            if {f"'{lua_escape(runtime_path)}'" if runtime_path else "nil"} then
-                config.cargo = {f"'{lua_escape(runtime_path)}'" if runtime_path else "nil"}
+            if runtime_path then
+                config.cargo = runtime_path
             end
         elseif filetype == 'go' then
             -- Go: Set dlv path if specified
-            if {f"'{lua_escape(runtime_path)}'" if runtime_path else "nil"} then
-                config.dlvToolPath = {f"'{lua_escape(runtime_path)}'" if runtime_path else "nil"}
+            if runtime_path then
+                config.dlvToolPath = runtime_path
             end
         end
         
@@ -1638,16 +2021,16 @@ end
         
         -- 🎯 Initialize session data in the registry
         -- Use the user-provided session_id as the key
-        _G.otter_session_registry[user_session_id] = {{
+        _G.otter_session_registry[user_session_id] = {
             pid = nil,
-            stdout = {{}},
-            stderr = {{}},
+            stdout = {},
+            stderr = {},
             exit_code = nil,
             terminated = false,
             start_time = os.time(),
             nvim_session_id = nil,  -- Will be filled after dap.run()
-            diagnostic_info = {{}},  -- Store diagnostic messages here
-        }}
+            diagnostic_info = {},  -- Store diagnostic messages here
+        }
         
         -- 🔍 Store DAP configuration for diagnostics
         -- This helps diagnose module-based debugging issues
@@ -1741,9 +2124,7 @@ end
         end
         
         -- 🎯 CORRECT WORKFLOW: Stop on entry, set breakpoints via DAP protocol, then continue
-        local breakpoint_lines = {breakpoint_lines_lua}
-        local filepath_for_bp = {filepath_lua}
-        local has_breakpoints = breakpoint_lines ~= nil and filepath_for_bp ~= nil
+        local has_breakpoints = breakpoint_lines ~= nil and filepath ~= nil
         
         -- If we have breakpoints, ALWAYS stop on entry so we can set them before execution
         if has_breakpoints then
@@ -1763,29 +2144,29 @@ end
             end, 50)
             
             if not waited or not session then
-                return {{error = 'Session did not stop on entry'}}
+                return {error = 'Session did not stop on entry'}
             end
             
             -- Build breakpoints for DAP setBreakpoints request
-            local bp_list = {{}}
+            local bp_list = {}
             for _, line in ipairs(breakpoint_lines) do
-                table.insert(bp_list, {{line = line}})
+                table.insert(bp_list, {line = line})
             end
             
             -- Send setBreakpoints request directly via DAP protocol
             -- This is the ONLY way to ensure breakpoints are actually sent to debugpy
-            local err, bp_response = session:request('setBreakpoints', {{
-                source = {{path = {filepath_lua}}},
+            local err, bp_response = session:request('setBreakpoints', {
+                source = {path = filepath},
                 breakpoints = bp_list,
-            }})
+            })
             
             if err then
-                return {{error = 'Failed to set breakpoints: ' .. tostring(err)}}
+                return {error = 'Failed to set breakpoints: ' .. tostring(err)}
             end
             
             -- If user didn't explicitly request stopOnEntry, continue execution
             -- (we only stopped to set breakpoints)
-            if not {str(stop_on_entry).lower()} then
+            if not stop_on_entry then
                 -- CRITICAL: Wait for breakpoints to be fully registered before continuing
                 -- Using vim.wait synchronously to ensure breakpoints are ready
                 vim.wait(500)  -- Give debugpy time to process breakpoints
@@ -1805,8 +2186,8 @@ end
             session_data.nvim_session_id = tostring(session.id)
             
             -- Get current data from registry
-            local stdout = table.concat(session_data.stdout or {{}}, '')
-            local stderr = table.concat(session_data.stderr or {{}}, '')
+            local stdout = table.concat(session_data.stdout or {}, '')
+            local stderr = table.concat(session_data.stderr or {}, '')
             local output = stdout .. stderr
             
             -- If we didn't get a PID within timeout, that's suspicious but not fatal
@@ -1817,27 +2198,40 @@ end
                 end
             end
             
-            return {{
+            return {
                 session_id = user_session_id,  -- User-provided ID (source of truth)
                 config_name = 'Otter Debug Session',
-                file = {filepath_lua},
-                module = {module_lua},
+                file = filepath,
+                module = module,
                 status = 'running',
                 pid = session_data.pid,
                 output = output,
                 stdout = stdout,
                 stderr = stderr,
-            }}
+            }
         else
             -- Clean up on failure
             _G.otter_session_registry[user_session_id] = nil
             
-            return {{ error = 'Failed to start debug session (timeout waiting for process)' }}
+            return { error = 'Failed to start debug session (timeout waiting for process)' }
         end
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(
+                lua_code,
+                filetype,
+                session_id,
+                module or None,
+                filepath or None,
+                args or None,
+                env or None,
+                cwd or None,
+                stop_on_entry,
+                just_my_code,
+                runtime_path or None,
+                breakpoints if breakpoints and filepath else None,
+            )
             return result
         except Exception as e:
             return {"error": f"Exception starting debug session: {str(e)}"}
@@ -1860,41 +2254,47 @@ end
         """
         buf_num = await self.open_file(filepath)
 
-        conditions_str = "{}"
-        if conditions:
-            # Build Lua table: {[line] = condition}
-            pairs = [f"[{line}] = '{cond}'" for line, cond in conditions.items()]
-            conditions_str = "{" + ", ".join(pairs) + "}"
-
-        lines_str = "{" + ", ".join(str(line) for line in lines) + "}"
-
-        lua_code = f"""
+        # lines and conditions arrive as a Lua list and a {[line] = condition}
+        # table, so conditions need no quoting
+        lua_code = """
+        local bufnr, lines, conditions = ...
         local dap = require('dap')
         local breakpoints = require('dap.breakpoints')
-        local bufnr = {buf_num}
-        local lines = {lines_str}
-        local conditions = {conditions_str}
         
         -- Set breakpoints
-        local result = {{}}
+        local result = {}
         for _, line in ipairs(lines) do
-            local bp = {{
+            local bp = {
                 line = line,
                 condition = conditions[line]
-            }}
+            }
             breakpoints.set(bp, bufnr, line)
-            table.insert(result, {{
+            table.insert(result, {
                 line = line,
                 verified = true,
                 condition = conditions[line]
-            }})
+            })
+        end
+        
+        -- Tell a running adapter in one setBreakpoints request for the file
+        -- (the request replaces the file's breakpoints, so send all of them)
+        local session = dap.session()
+        if session then
+            local source_bps = {}
+            for _, bp in ipairs(breakpoints.get(bufnr)[bufnr] or {}) do
+                table.insert(source_bps, {line = bp.line, condition = bp.condition})
+            end
+            session:request('setBreakpoints', {
+                source = {path = vim.api.nvim_buf_get_name(bufnr)},
+                breakpoints = source_bps
+            }, function() end)
         end
         
         return result
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(lua_code, buf_num, lines, conditions or {})
             return result if result else []
         except Exception:
             return []
@@ -1911,8 +2311,11 @@ end
         
         dap.continue()
         
-        -- Wait for state change
-        vim.wait(200)
+        -- Wait for state change: ends early if a breakpoint is hit or the
+        -- session ends
+        vim.wait(200, function()
+            return dap.session() ~= session or session.stopped_thread_id ~= nil
+        end, 5)
         
         return {status = 'running'}
         """
@@ -1934,7 +2337,10 @@ end
         end
         
         dap.step_over()
-        vim.wait(200)
+        -- Ends as soon as the adapter reports the stop (or the session ends)
+        vim.wait(200, function()
+            return dap.session() ~= session or session.stopped_thread_id ~= nil
+        end, 5)
         
         return {status = 'paused'}
         """
@@ -1956,7 +2362,10 @@ end
         end
         
         dap.step_into()
-        vim.wait(200)
+        -- Ends as soon as the adapter reports the stop (or the session ends)
+        vim.wait(200, function()
+            return dap.session() ~= session or session.stopped_thread_id ~= nil
+        end, 5)
         
         return {status = 'paused'}
         """
@@ -1978,7 +2387,10 @@ end
         end
         
         dap.step_out()
-        vim.wait(200)
+        -- Ends as soon as the adapter reports the stop (or the session ends)
+        vim.wait(200, function()
+            return dap.session() ~= session or session.stopped_thread_id ~= nil
+        end, 5)
         
         return {status = 'paused'}
         """
@@ -2000,7 +2412,10 @@ end
         end
         
         dap.pause()
-        vim.wait(200)
+        -- Ends as soon as the adapter reports the stop (or the session ends)
+        vim.wait(200, function()
+            return dap.session() ~= session or session.stopped_thread_id ~= nil
+        end, 5)
         
         return {status = 'paused'}
         """
@@ -2119,7 +2534,8 @@ end
         Returns:
             List of scope dicts
         """
-        lua_code = f"""
+        lua_code = """
+        local frame_id = ...
         local dap = require('dap')
         local session = dap.session()
         
@@ -2128,32 +2544,35 @@ end
         end
         
         local result = nil
-        session:request('scopes', {{frameId = {frame_id}}}, function(err, response)
+        local done = false
+        session:request('scopes', {frameId = frame_id}, function(err, response)
+            done = true
             if not err and response then
-                result = response.scopes or {{}}
+                result = response.scopes or {}
             end
         end)
         
-        vim.wait(500)
+        -- Returns as soon as the adapter answers (or errors)
+        vim.wait(500, function() return done end, 5)
         
         if not result then
             return nil
         end
         
-        local scopes = {{}}
+        local scopes = {}
         for _, scope in ipairs(result) do
-            table.insert(scopes, {{
+            table.insert(scopes, {
                 name = scope.name,
                 variables_reference = scope.variablesReference,
                 expensive = scope.expensive or false
-            }})
+            })
         end
         
         return scopes
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(lua_code, frame_id)
             return result if result else []
         except Exception:
             return []
@@ -2169,7 +2588,8 @@ end
         Returns:
             List of variable dicts
         """
-        lua_code = f"""
+        lua_code = """
+        local variables_reference = ...
         local dap = require('dap')
         local session = dap.session()
         
@@ -2178,37 +2598,136 @@ end
         end
         
         local result = nil
-        session:request('variables', {{variablesReference = {variables_reference}}}, function(err, response)
+        local done = false
+        session:request('variables', {variablesReference = variables_reference}, function(err, response)
+            done = true
             if not err and response then
-                result = response.variables or {{}}
+                result = response.variables or {}
             end
         end)
         
-        vim.wait(500)
+        -- Returns as soon as the adapter answers (or errors)
+        vim.wait(500, function() return done end, 5)
         
         if not result then
             return nil
         end
         
-        local variables = {{}}
+        local variables = {}
         for _, var in ipairs(result) do
-            table.insert(variables, {{
+            table.insert(variables, {
                 name = var.name,
                 value = var.value,
                 type = var.type,
                 variables_reference = var.variablesReference or 0
-            }})
+            })
         end
         
         return variables
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(lua_code, variables_reference)
             return result if result else []
         except Exception:
             return []
 
+    async def dap_get_frame_state(
+        self, frame_id: int, expression: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get scopes, their variables and an optional evaluation in one round-trip.
+
+        The 'variables' requests for every scope (and the 'evaluate' request)
+        are all in flight at once, and the wait ends as soon as the adapter has
+        answered them, instead of one fixed wait per request.
+
+        Args:
+            frame_id: Stack frame ID
+            expression: Optional expression to evaluate in the frame
+
+        Returns:
+            Dict with 'scopes' (list of scope dicts), 'variables' (scope name ->
+            list of variable dicts) and, if requested, 'evaluation'
+        """
+        lua_code = """
+        local expression, frame_id = ...
+        -- A Python None arrives as vim.NIL, which is truthy
+        if expression == vim.NIL then
+            expression = nil
+        end
+        local dap = require('dap')
+        local session = dap.session()
+        
+        if not session then
+            return nil
+        end
+        
+        local pending = 0
+        local state = {scopes = {}, variables = vim.empty_dict()}
+        
+        if expression then
+            pending = pending + 1
+            session:request('evaluate', {
+                expression = expression,
+                frameId = frame_id,
+                context = 'repl'
+            }, function(err, response)
+                if err then
+                    state.evaluation = {error = err.message or 'Evaluation failed'}
+                elseif response then
+                    state.evaluation = {
+                        result = response.result,
+                        type = response.type,
+                        variables_reference = response.variablesReference or 0
+                    }
+                end
+                pending = pending - 1
+            end)
+        end
+        
+        pending = pending + 1
+        session:request('scopes', {frameId = frame_id}, function(err, response)
+            if not err and response then
+                for _, scope in ipairs(response.scopes or {}) do
+                    table.insert(state.scopes, {
+                        name = scope.name,
+                        variables_reference = scope.variablesReference,
+                        expensive = scope.expensive or false
+                    })
+                    if scope.variablesReference > 0 then
+                        pending = pending + 1
+                        session:request('variables', {variablesReference = scope.variablesReference}, function(verr, vresponse)
+                            if not verr and vresponse and vresponse.variables then
+                                local variables = {}
+                                for _, var in ipairs(vresponse.variables) do
+                                    table.insert(variables, {
+                                        name = var.name,
+                                        value = var.value,
+                                        type = var.type,
+                                        variables_reference = var.variablesReference or 0
+                                    })
+                                end
+                                state.variables[scope.name] = variables
+                            end
+                            pending = pending - 1
+                        end)
+                    end
+                end
+            end
+            pending = pending - 1
+        end)
+        
+        vim.wait(1000, function() return pending == 0 end, 10)
+        
+        return state
+        """
+
+        try:
+            result = await self.execute_lua(lua_code, expression, frame_id)
+            return result if isinstance(result, dict) else {}
+        except Exception:
+            return {}
+
     async def dap_evaluate(
         self, expression: str, frame_id: Optional[int] = None, context: str = "repl"
     ) -> Optional[Dict[str, Any]]:
@@ -2222,43 +2741,47 @@ end
         Returns:
             Evaluation result dict
         """
-        frame_id_str = str(frame_id) if frame_id is not None else "nil"
-
-        # Escape single quotes in expression
-        expression_escaped = expression.replace("'", "\\'")
-
-        lua_code = f"""
+        # The expression is passed as a value, so quotes in it need no escaping
+        lua_code = """
+        local expression, frame_id, context = ...
+        -- A Python None arrives as vim.NIL; leave frameId out instead of null
+        if frame_id == vim.NIL then
+            frame_id = nil
+        end
         local dap = require('dap')
         local session = dap.session()
         
         if not session then
-            return {{error = 'No active debug session'}}
+            return {error = 'No active debug session'}
         end
         
         local result = nil
-        session:request('evaluate', {{
-            expression = '{expression_escaped}',
-            frameId = {frame_id_str},
-            context = '{context}'
-        }}, function(err, response)
+        local done = false
+        session:request('evaluate', {
+            expression = expression,
+            frameId = frame_id,
+            context = context
+        }, function(err, response)
+            done = true
             if err then
-                result = {{error = err.message or 'Evaluation failed'}}
+                result = {error = err.message or 'Evaluation failed'}
             elseif response then
-                result = {{
+                result = {
                     result = response.result,
                     type = response.type,
                     variables_reference = response.variablesReference or 0
-                }}
+                }
             end
         end)
         
-        vim.wait(500)
+        -- Returns as soon as the adapter answers (or errors)
+        vim.wait(500, function() return done end, 5)
         
         return result
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(lua_code, expression, frame_id, context)
             return result
         except Exception:
             return None
@@ -2307,16 +2830,16 @@ end
             Dict with status, pid, output, etc. or None if session not found
         """
         # Look up session directly by the provided session_id
-        lua_code = f"""
+        lua_code = """
+        local user_session_id, max_lines = ...
         local dap = require('dap')
-        local user_session_id = '{session_id}'
-        _G.otter_session_registry = _G.otter_session_registry or {{}}
+        _G.otter_session_registry = _G.otter_session_registry or {}
         
         -- Look up the session data by the user-provided ID
         local session_data = _G.otter_session_registry[user_session_id]
         
         if not session_data then
-            return {{
+            return {
                 status = 'no_session',
                 error = string.format('Session "%s" not found. It may have been cleaned up (crashes kept for 5 minutes, clean exits for 30 seconds).', user_session_id),
                 stdout = '',
@@ -2324,7 +2847,7 @@ end
                 pid = nil,
                 exit_code = nil,
                 terminated = true,
-            }}
+            }
         end
         
         -- Determine status by checking if the nvim session is still active
@@ -2389,9 +2912,8 @@ end
         end
         
         -- 🎯 Smart output limiting to prevent context explosion
-        local max_lines = {max_output_lines}
-        local stdout_lines = session_data.stdout or {{}}
-        local stderr_lines = session_data.stderr or {{}}
+        local stdout_lines = session_data.stdout or {}
+        local stderr_lines = session_data.stderr or {}
         local total_stdout_lines = #stdout_lines
         local total_stderr_lines = #stderr_lines
         
@@ -2412,7 +2934,7 @@ end
             -- Last N lines
             if total_stdout_lines > max_lines then
                 local start_idx = total_stdout_lines - max_lines + 1
-                local limited_stdout = {{}}
+                local limited_stdout = {}
                 for i = start_idx, total_stdout_lines do
                     table.insert(limited_stdout, stdout_lines[i])
                 end
@@ -2424,7 +2946,7 @@ end
             
             if total_stderr_lines > max_lines then
                 local start_idx = total_stderr_lines - max_lines + 1
-                local limited_stderr = {{}}
+                local limited_stderr = {}
                 for i = start_idx, total_stderr_lines do
                     table.insert(limited_stderr, stderr_lines[i])
                 end
@@ -2435,7 +2957,7 @@ end
             end
         end
         
-        return {{
+        return {
             session_id = user_session_id,  -- Return the user-provided ID
             status = status,
             pid = session_data.pid,
@@ -2449,12 +2971,12 @@ end
             terminated = session_data.terminated or false,
             uptime_seconds = uptime,
             crash_reason = crash_reason,
-            diagnostic_info = session_data.diagnostic_info or {{}},  -- Include diagnostic logs
-        }}
+            diagnostic_info = session_data.diagnostic_info or {},  -- Include diagnostic logs
+        }
         """
 
         try:
-            result = await self.execute_lua(lua_code)
+            result = await self.execute_lua(lua_code, session_id, max_output_lines)
             return result
         except Exception as e:
             return {"status": "error", "error": str(e)}
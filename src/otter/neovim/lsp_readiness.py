@@ -42,8 +42,7 @@ async def wait_for_lsp_ready(
             print("LSP check failed: nvim_client.nvim is None", file=sys.stderr)
         return False
 
-    start_time = asyncio.get_event_loop().time()
-    loop = asyncio.get_event_loop()
+    start_time = asyncio.get_running_loop().time()
 
     # Ensure file is opened in a buffer with correct filetype
     try:
@@ -56,7 +55,7 @@ async def wait_for_lsp_ready(
         return False
 
     while True:
-        elapsed = asyncio.get_event_loop().time() - start_time
+        elapsed = asyncio.get_running_loop().time() - start_time
         if elapsed >= timeout:
             if verbose:
                 print(
@@ -67,40 +66,37 @@ async def wait_for_lsp_ready(
 
         try:
             # Check LSP client status using Neovim API
-            result = await loop.run_in_executor(
-                None,
-                lambda: nvim_client.nvim.exec_lua(
-                    """
-                    local filepath = ...
-                    local bufnr = vim.fn.bufnr(filepath)
-                    
-                    if bufnr == -1 then
-                        return {error = "buffer not found"}
-                    end
-                    
-                    -- Get attached LSP clients
-                    local clients = vim.lsp.get_active_clients({bufnr = bufnr})
-                    
-                    if #clients == 0 then
-                        return {clients = 0, ready = false}
-                    end
-                    
-                    -- Check if any client is initialized
-                    local ready_count = 0
-                    for _, client in ipairs(clients) do
-                        if client.initialized then
-                            ready_count = ready_count + 1
-                        end
+            result = await nvim_client.execute_lua(
+                """
+                local filepath = ...
+                local bufnr = vim.fn.bufnr(filepath)
+                
+                if bufnr == -1 then
+                    return {error = "buffer not found"}
+                end
+                
+                -- Get attached LSP clients
+                local clients = vim.lsp.get_active_clients({bufnr = bufnr})
+                
+                if #clients == 0 then
+                    return {clients = 0, ready = false}
+                end
+                
+                -- Check if any client is initialized
+                local ready_count = 0
+                for _, client in ipairs(clients) do
+                    if client.initialized then
+                        ready_count = ready_count + 1
                     end
-                    
-                    return {
-                        clients = #clients,
-                        ready = ready_count > 0,
-                        ready_count = ready_count
-                    }
-                    """,
-                    file_path,
-                ),
+                end
+                
+                return {
+                    clients = #clients,
+                    ready = ready_count > 0,
+                    ready_count = ready_count
+                }
+                """,
+                file_path,
             )
 
             if isinstance(result, dict):
@@ -176,11 +172,10 @@ async def wait_for_lsp_indexed(
     if verbose:
         print("LSP attached, now waiting for indexing...", file=sys.stderr)
 
-    start_time = asyncio.get_event_loop().time()
-    loop = asyncio.get_event_loop()
+    start_time = asyncio.get_running_loop().time()
 
     while True:
-        elapsed = asyncio.get_event_loop().time() - start_time
+        elapsed = asyncio.get_running_loop().time() - start_time
         remaining_time = timeout - elapsed
 
         if remaining_time <= 0:
@@ -190,121 +185,118 @@ async def wait_for_lsp_indexed(
 
         try:
             # Make actual LSP requests to verify indexing
-            result = await loop.run_in_executor(
-                None,
-                lambda: nvim_client.nvim.exec_lua(
-                    """
-                    local filepath = ...
-                    local bufnr = vim.fn.bufnr(filepath)
-                    
-                    if bufnr == -1 then
-                        return {error = "buffer not found"}
+            result = await nvim_client.execute_lua(
+                """
+                local filepath = ...
+                local bufnr = vim.fn.bufnr(filepath)
+                
+                if bufnr == -1 then
+                    return {error = "buffer not found"}
+                end
+                
+                local clients = vim.lsp.get_active_clients({bufnr = bufnr})
+                if #clients == 0 then
+                    return {error = "no clients"}
+                end
+                
+                -- Get the first initialized client
+                local client = nil
+                for _, c in ipairs(clients) do
+                    if c.initialized then
+                        client = c
+                        break
                     end
+                end
+                
+                if not client then
+                    return {error = "no initialized clients"}
+                end
+                
+                -- Strategy: Make multiple request types to verify full readiness
+                local checks = {}
+                
+                -- Check 1: Server capabilities
+                local has_symbols = client.server_capabilities.documentSymbolProvider
+                local has_hover = client.server_capabilities.hoverProvider
+                checks.has_symbols = has_symbols
+                checks.has_hover = has_hover
+                
+                -- Check 2: Request document symbols (proves semantic analysis ready)
+                if has_symbols then
+                    local symbol_params = {
+                        textDocument = { uri = vim.uri_from_fname(filepath) }
+                    }
                     
-                    local clients = vim.lsp.get_active_clients({bufnr = bufnr})
-                    if #clients == 0 then
-                        return {error = "no clients"}
-                    end
+                    local symbols = nil
+                    local symbol_err = nil
+                    
+                    -- Use buf_request_sync with a short timeout (deterministic!)
+                    local responses = vim.lsp.buf_request_sync(
+                        bufnr,
+                        "textDocument/documentSymbol",
+                        symbol_params,
+                        2000  -- 2 second timeout per request
+                    )
                     
-                    -- Get the first initialized client
-                    local client = nil
-                    for _, c in ipairs(clients) do
-                        if c.initialized then
-                            client = c
-                            break
+                    if responses then
+                        for client_id, resp in pairs(responses) do
+                            if resp.result then
+                                symbols = resp.result
+                                break
+                            elseif resp.err then
+                                symbol_err = resp.err.message
+                            end
                         end
                     end
                     
-                    if not client then
-                        return {error = "no initialized clients"}
+                    if symbols and #symbols > 0 then
+                        checks.symbols_ready = true
+                        checks.symbol_count = #symbols
+                        -- Success! We got symbols, LSP is fully indexed
+                        return {ready = true, checks = checks}
+                    elseif symbols then
+                        checks.symbols_ready = true
+                        checks.symbol_count = 0
+                        checks.symbols_empty = true
+                    else
+                        checks.symbols_ready = false
+                        checks.symbol_error = symbol_err or "no response"
                     end
+                end
+                
+                -- Check 3: If no symbols, try hover to verify semantic analysis
+                -- (Some files legitimately have no symbols but LSP should still work)
+                if has_hover then
+                    -- Try hover on first line to test semantic analysis
+                    local hover_params = {
+                        textDocument = { uri = vim.uri_from_fname(filepath) },
+                        position = { line = 0, character = 0 }
+                    }
                     
-                    -- Strategy: Make multiple request types to verify full readiness
-                    local checks = {}
-                    
-                    -- Check 1: Server capabilities
-                    local has_symbols = client.server_capabilities.documentSymbolProvider
-                    local has_hover = client.server_capabilities.hoverProvider
-                    checks.has_symbols = has_symbols
-                    checks.has_hover = has_hover
-                    
-                    -- Check 2: Request document symbols (proves semantic analysis ready)
-                    if has_symbols then
-                        local symbol_params = {
-                            textDocument = { uri = vim.uri_from_fname(filepath) }
-                        }
-                        
-                        local symbols = nil
-                        local symbol_err = nil
-                        
-                        -- Use buf_request_sync with a short timeout (deterministic!)
-                        local responses = vim.lsp.buf_request_sync(
-                            bufnr,
-                            "textDocument/documentSymbol",
-                            symbol_params,
-                            2000  -- 2 second timeout per request
-                        )
-                        
-                        if responses then
-                            for client_id, resp in pairs(responses) do
-                                if resp.result then
-                                    symbols = resp.result
-                                    break
-                                elseif resp.err then
-                                    symbol_err = resp.err.message
-                                end
-                            end
-                        end
-                        
-                        if symbols and #symbols > 0 then
-                            checks.symbols_ready = true
-                            checks.symbol_count = #symbols
-                            -- Success! We got symbols, LSP is fully indexed
-                            return {ready = true, checks = checks}
-                        elseif symbols then
-                            checks.symbols_ready = true
-                            checks.symbol_count = 0
-                            checks.symbols_empty = true
-                        else
-                            checks.symbols_ready = false
-                            checks.symbol_error = symbol_err or "no response"
-                        end
-                    end
+                    local hover_responses = vim.lsp.buf_request_sync(
+                        bufnr,
+                        "textDocument/hover",
+                        hover_params,
+                        2000
+                    )
                     
-                    -- Check 3: If no symbols, try hover to verify semantic analysis
-                    -- (Some files legitimately have no symbols but LSP should still work)
-                    if has_hover then
-                        -- Try hover on first line to test semantic analysis
-                        local hover_params = {
-                            textDocument = { uri = vim.uri_from_fname(filepath) },
-                            position = { line = 0, character = 0 }
-                        }
-                        
-                        local hover_responses = vim.lsp.buf_request_sync(
-                            bufnr,
-                            "textDocument/hover",
-                            hover_params,
-                            2000
-                        )
-                        
-                        if hover_responses then
-                            for client_id, resp in pairs(hover_responses) do
-                                if resp.result and resp.result.contents then
-                                    checks.hover_ready = true
-                                    -- If hover works, consider it ready even without symbols
-                                    if not checks.symbols_ready or checks.symbols_empty then
-                                        return {ready = true, checks = checks}
-                                    end
+                    if hover_responses then
+                        for client_id, resp in pairs(hover_responses) do
+                            if resp.result and resp.result.contents then
+                                checks.hover_ready = true
+                                -- If hover works, consider it ready even without symbols
+                                if not checks.symbols_ready or checks.symbols_empty then
+                                    return {ready = true, checks = checks}
                                 end
                             end
                         end
                     end
-                    
-                    -- Not ready yet, return status for debugging
-                    return {ready = false, checks = checks}
-                    """,
-                    file_path,
-                ),
+                end
+                
+                -- Not ready yet, return status for debugging
+                return {ready = false, checks = checks}
+                """,
+                file_path,
             )
 
             if isinstance(result, dict):
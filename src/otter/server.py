@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
@@ -42,6 +43,10 @@ from .services.navigation import NavigationService
 from .services.refactoring import RefactoringService
 from .services.workspace import WorkspaceService
 
+# Index prewarming: how many source files to open, and how many per round-trip
+_WARM_MAX_FILES = 128
+_WARM_BATCH_SIZE = 32
+
 
 class CliIdeServer:
     """Server facade delegating requests to service layers.
@@ -103,6 +108,38 @@ class CliIdeServer:
         """Stop the Neovim instance and clean up resources."""
         await self.nvim_client.stop()
 
+    async def warm_index(self) -> None:
+        """Open the project's source files so LSP servers index them up front.
+
+        Meant to run as a background task right after start(): the first
+        rename/references/symbols call then hits an already-built index instead
+        of paying for it. Files are opened in batches (one Neovim round-trip per
+        batch), walking the tree top-down. Best-effort - failures are ignored.
+        """
+        try:
+            files = await asyncio.to_thread(self._find_warm_files)
+            for i in range(0, len(files), _WARM_BATCH_SIZE):
+                await self.nvim_client.open_files(files[i : i + _WARM_BATCH_SIZE])
+        except Exception:
+            pass
+
+    def _find_warm_files(self) -> List[str]:
+        """List up to _WARM_MAX_FILES source files of the enabled languages."""
+        from .config.parser import EXTENSION_LANGUAGES, IGNORED_DIRS
+
+        languages = set(self.nvim_client.enabled_languages)
+        files: List[str] = []
+        for root, dirs, names in os.walk(self.project_path):
+            dirs[:] = sorted(
+                d for d in dirs if d not in IGNORED_DIRS and not d.startswith(".")
+            )
+            for name in sorted(names):
+                if EXTENSION_LANGUAGES.get(Path(name).suffix) in languages:
+                    files.append(os.path.join(root, name))
+                    if len(files) >= _WARM_MAX_FILES:
+                        return files
+        return files
+
     # Navigation & Discovery
     async def find_definition(
         self, symbol: str, file: Optional[str] = None, line: Optional[int] = None
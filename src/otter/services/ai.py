@@ -7,9 +7,11 @@ designed to help agents reduce context usage.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any, List, Literal, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 from ..llm import LLMClient, LLMConfig, ModelTier
 from ..models.responses import (
@@ -446,8 +448,23 @@ Be practical and concise."""
                 "explain_symbol requires nvim_client for LSP integration"
             )
 
-        # 1. Get hover info (definition) - use lsp_hover directly
-        lsp_hover_result = await self.nvim_client.lsp_hover(file, line, character)
+        # 1. Get hover info (definition) and, optionally, references - the two
+        # LSP requests don't depend on each other, so run them concurrently
+        async def get_references() -> Optional[List[Dict[str, Any]]]:
+            try:
+                # Use lsp_references directly from nvim_client
+                return await self.nvim_client.lsp_references(file, line, character)
+            except Exception as e:
+                logger.warning(f"Failed to get references for symbol explanation: {e}")
+                return None
+
+        if include_references:
+            lsp_hover_result, lsp_references = await asyncio.gather(
+                self.nvim_client.lsp_hover(file, line, character), get_references()
+            )
+        else:
+            lsp_hover_result = await self.nvim_client.lsp_hover(file, line, character)
+            lsp_references = None
 
         if not lsp_hover_result:
             raise RuntimeError(f"No symbol found at {file}:{line}:{character}")
@@ -469,66 +486,20 @@ Be practical and concise."""
         else:
             hover_info = str(hover_contents)
 
-        # 2. Optionally get references
+        # 2. Turn a few references into usage snippets (limit to avoid context bloat)
         references_context = ""
-        if include_references:
-            try:
-                # Use lsp_references directly from nvim_client
-                lsp_references = await self.nvim_client.lsp_references(
-                    file, line, character
+        if lsp_references:
+            reference_snippets = await asyncio.to_thread(
+                self._read_reference_snippets,
+                lsp_references[:5],  # Max 5 references
+            )
+            if reference_snippets:
+                references_context = "\n\nUsage examples:\n" + "\n\n".join(
+                    reference_snippets
+                )
+                references_context += (
+                    f"\n\n(Found {len(lsp_references)} total references)"
                 )
-
-                if lsp_references:
-                    # Get a few reference snippets (limit to avoid context bloat)
-                    reference_snippets = []
-                    for ref_location in lsp_references[:5]:  # Max 5 references
-                        try:
-                            from pathlib import Path
-                            from urllib.parse import unquote, urlparse
-
-                            # Parse LSP location
-                            uri = ref_location.get("uri") or ref_location.get(
-                                "targetUri"
-                            )
-                            range_data = ref_location.get("range") or ref_location.get(
-                                "targetRange"
-                            )
-
-                            if not uri or not range_data:
-                                continue
-
-                            # Convert URI to file path
-                            if uri.startswith("file://"):
-                                parsed = urlparse(uri)
-                                ref_file = unquote(parsed.path)
-                            else:
-                                ref_file = uri
-
-                            ref_line = (
-                                range_data["start"]["line"] + 1
-                            )  # Convert to 1-indexed
-
-                            # Read file and get context
-                            ref_content = Path(ref_file).read_text().split("\n")
-                            # Get 3 lines of context around reference
-                            start = max(0, ref_line - 2)
-                            end = min(len(ref_content), ref_line + 1)
-                            snippet = "\n".join(ref_content[start:end])
-                            reference_snippets.append(
-                                f"# {ref_file}:{ref_line}\n{snippet}"
-                            )
-                        except Exception:
-                            continue
-
-                    if reference_snippets:
-                        references_context = "\n\nUsage examples:\n" + "\n\n".join(
-                            reference_snippets
-                        )
-                        references_context += (
-                            f"\n\n(Found {len(lsp_references)} total references)"
-                        )
-            except Exception as e:
-                logger.warning(f"Failed to get references for symbol explanation: {e}")
 
         # 3. Build prompt
         prompt = f"""Explain this code symbol:
@@ -558,3 +529,39 @@ Total: 4-6 sentences."""
             summary=response,
             detail_level="detailed",
         )
+
+    def _read_reference_snippets(self, locations: List[Dict[str, Any]]) -> List[str]:
+        """Read 3 lines of context around each LSP location (each file read once)."""
+        files: Dict[str, List[str]] = {}
+        snippets = []
+        for ref_location in locations:
+            try:
+                # Parse LSP location
+                uri = ref_location.get("uri") or ref_location.get("targetUri")
+                range_data = ref_location.get("range") or ref_location.get(
+                    "targetRange"
+                )
+
+                if not uri or not range_data:
+                    continue
+
+                # Convert URI to file path
+                if uri.startswith("file://"):
+                    ref_file = unquote(urlparse(uri).path)
+                else:
+                    ref_file = uri
+
+                ref_line = range_data["start"]["line"] + 1  # Convert to 1-indexed
+
+                # Read file and get context
+                if ref_file not in files:
+                    files[ref_file] = Path(ref_file).read_text().split("\n")
+                ref_content = files[ref_file]
+                # Get 3 lines of context around reference
+                start = max(0, ref_line - 2)
+                end = min(len(ref_content), ref_line + 1)
+                snippet = "\n".join(ref_content[start:end])
+                snippets.append(f"# {ref_file}:{ref_line}\n{snippet}")
+            except Exception:
+                continue
+        return snippets
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import subprocess
 from pathlib import Path
-from typing import Any, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from ..models.responses import (
     CodeExplanation,
@@ -11,6 +15,16 @@ from ..models.responses import (
 )
 from ..utils.path import normalize_path_for_response, resolve_workspace_path
 
+# Source files searched for reverse dependencies (ripgrep type and glob filters)
+_RG_FILE_FILTERS = (
+    "-t py -t js -t ts -t rust -t go -t ruby -t php -t java -t cpp -t c "
+    "-g !**/node_modules/** -g !**/.git/** -g !**/venv/** -g !**/__pycache__/** "
+    "-g !**/target/** -g !**/build/** -g !**/dist/**"
+).split()
+
+# Lines that can possibly match an import pattern in _get_imported_by_via_search
+_IMPORT_LINE_RE = re.compile(r"import|require|include|\bfrom\b|\buse\b")
+
 
 class AnalysisService:
     def __init__(self, nvim_client: Any, project_path: Optional[str] = None) -> None:
@@ -23,6 +37,11 @@ class AnalysisService:
         self.nvim_client = nvim_client
         self.project_path = Path(project_path) if project_path else Path.cwd()
 
+        # Imports per file: path -> ((bufnr, changedtick), imports)
+        self._imports_cache: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
+        # Import-like lines per source file: path -> (mtime_ns, lines)
+        self._import_lines: Dict[str, Tuple[int, List[str]]] = {}
+
         # TreeSitter queries for finding imports across different languages
         # These capture the MODULE NAME directly, not the whole statement!
         # This makes downstream processing language-agnostic.
@@ -145,10 +164,20 @@ class AnalysisService:
         """
         try:
             # Open the file in Neovim
-            await self.nvim_client.open_file(str(file_path))
+            bufnr = await self.nvim_client.open_file(str(file_path), wait_for_lsp=False)
 
-            # Get the filetype from Neovim
-            filetype = await self.nvim_client.execute_lua("return vim.bo.filetype")
+            # Get the filetype and change counter from Neovim (by buffer - an
+            # already-open file is not made current again)
+            filetype, changedtick = await self.nvim_client.execute_lua(
+                "local b = ... return {vim.bo[b].filetype, vim.b[b].changedtick}",
+                bufnr,
+            )
+
+            # Unchanged buffer since the last call: reuse its imports
+            cache_key = (bufnr, changedtick)
+            cached = self._imports_cache.get(str(file_path))
+            if cached and cached[0] == cache_key:
+                return list(cached[1])
 
             # Get the appropriate TreeSitter query for this language
             query = self._import_queries.get(filetype)
@@ -185,7 +214,9 @@ class AnalysisService:
             # Clean the module names (remove quotes, etc.)
             imports = self._extract_module_names(module_names, filetype)
 
-            return sorted(set(imports))  # Remove duplicates and sort
+            imports = sorted(set(imports))  # Remove duplicates and sort
+            self._imports_cache[str(file_path)] = (cache_key, imports)
+            return list(imports)
 
         except Exception as e:
             # TreeSitter not available or failed - raise descriptive exception
@@ -231,7 +262,7 @@ class AnalysisService:
         return cleaned
 
     async def _get_imported_by_via_search(self, target_file: Path) -> List[str]:
-        """Find files that import the target file using ripgrep (language-agnostic).
+        """Find files that import the target file (language-agnostic).
 
         Uses a generic regex pattern that matches common import/require/use syntax
         across most programming languages.
@@ -240,13 +271,14 @@ class AnalysisService:
         that captures the common structure:
         - Import keyword: import, from, require, use, include, etc.
         - Module reference: the filename/module we're looking for
+
+        Candidate files come from ripgrep (so .gitignore and type filters apply),
+        but their import-like lines are cached per file and only re-read when
+        the file's mtime changes - repeat calls don't rescan the project.
         """
         try:
             # Get the module/file name to search for
-            file_stem = target_file.stem  # filename without extension
-            import re as regex_module
-
-            escaped_stem = regex_module.escape(file_stem)
+            escaped_stem = re.escape(target_file.stem)  # filename without extension
 
             # Generic pattern that matches import statements across languages
             # This covers:
@@ -274,56 +306,11 @@ class AnalysisService:
             ]
 
             # Combine patterns with OR
-            combined_pattern = "|".join(patterns)
-            # Escape single quotes for Lua string (use [[...]] for raw string)
+            combined_pattern = re.compile("|".join(patterns))
 
-            # Use ripgrep with regex and file list output
-            lua_code = f"""
-            local pattern = [[{combined_pattern}]]
-            local project_path = '{self.project_path}'
-            local target = '{target_file}'
-            
-            -- Build and execute ripgrep command (language-agnostic)
-            -- Use vim.fn.shellescape to properly escape the pattern
-            -- Search all source code files (use ripgrep's built-in type filtering)
-            -- This covers Python, JS, TS, Rust, Go, Ruby, PHP, Java, C, C++, and more!
-            local cmd = string.format(
-                "rg -e %s -l -t py -t js -t ts -t rust -t go -t ruby -t php -t java -t cpp -t c -g '!**/node_modules/**' -g '!**/.git/**' -g '!**/venv/**' -g '!**/__pycache__/**' -g '!**/target/**' -g '!**/build/**' -g '!**/dist/**' %s",
-                vim.fn.shellescape(pattern),
-                vim.fn.shellescape(project_path)
+            return await asyncio.to_thread(
+                self._search_import_lines, combined_pattern, target_file
             )
-            
-            local results = vim.fn.systemlist(cmd)
-            
-            -- Check for errors (ripgrep returns 1 if no matches, which is ok)
-            local v_shell_error = vim.v.shell_error
-            if v_shell_error > 1 then
-                -- Error other than "no matches found"
-                return {{}}
-            end
-            
-            -- Filter out the target file itself and make paths relative
-            local filtered = {{}}
-            for _, path in ipairs(results) do
-                -- Skip empty lines and error messages
-                if path and path ~= '' and not path:match('^rg:') and not path:match('^zsh:') then
-                    local resolved_path = vim.fn.fnamemodify(path, ':p')
-                    local target_resolved = vim.fn.fnamemodify(target, ':p')
-                    
-                    if resolved_path ~= target_resolved then
-                        -- Make path relative to project
-                        local rel = path:gsub('^' .. project_path .. '/', '')
-                        table.insert(filtered, rel)
-                    end
-                end
-            end
-            
-            return filtered
-            """
-
-            imported_by = await self.nvim_client.execute_lua(lua_code)
-
-            return sorted(set(imported_by)) if imported_by else []
         except Exception as e:
             # If ripgrep or search fails, raise descriptive exception
             raise RuntimeError(
@@ -331,3 +318,65 @@ class AnalysisService:
                 f"Ripgrep may not be installed or accessible. "
                 f"Error: {str(e)}"
             )
+
+    def _search_import_lines(self, pattern: re.Pattern[str], target: Path) -> List[str]:
+        """Match pattern against the cached import-like lines of every source file."""
+        project_path = str(self.project_path)
+        result = subprocess.run(
+            ["rg", "--files", *_RG_FILE_FILTERS, project_path],
+            capture_output=True,
+            text=True,
+        )
+        # ripgrep returns 1 if no files matched, which is ok
+        if result.returncode > 1:
+            return []
+
+        target_resolved = os.path.abspath(target)
+        # Runs in a worker thread, possibly several at once: read the shared
+        # map but fill a fresh one, then swap it in. Files no longer listed
+        # (deleted or now ignored) drop out with the old map.
+        previous = self._import_lines
+        current: Dict[str, Tuple[int, List[str]]] = {}
+        imported_by = set()
+        for path in result.stdout.splitlines():
+            if not path:
+                continue
+            lines = self._get_import_lines(path, previous, current)
+            if not any(pattern.search(line) for line in lines):
+                continue
+            if os.path.abspath(path) == target_resolved:
+                continue
+            # Make path relative to project
+            prefix = project_path.rstrip("/") + "/"
+            imported_by.add(path[len(prefix) :] if path.startswith(prefix) else path)
+
+        self._import_lines = current
+        return sorted(imported_by)
+
+    def _get_import_lines(
+        self,
+        path: str,
+        previous: Dict[str, Tuple[int, List[str]]],
+        current: Dict[str, Tuple[int, List[str]]],
+    ) -> List[str]:
+        """Get the import-like lines of a file, re-reading it only if it changed.
+
+        Looks the file up in `previous` and records the result in `current`.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+        cached = previous.get(path)
+        if cached and cached[0] == mtime:
+            current[path] = cached
+            return cached[1]
+
+        try:
+            with open(path, "rb") as f:
+                text = f.read().decode("utf-8", errors="replace")
+        except OSError:
+            return []
+        lines = [line for line in text.splitlines() if _IMPORT_LINE_RE.search(line)]
+        current[path] = (mtime, lines)
+        return lines
@@ -391,9 +391,11 @@ class DebugService:
         else:
             result["stack_frames"] = []
 
-        # Get scopes and variables if frame specified
+        # Get scopes, variables and the evaluation if frame specified - all in
+        # a single round-trip with the DAP requests in flight concurrently
         if frame_id is not None:
-            scopes = await self.nvim_client.dap_get_scopes(frame_id)
+            state = await self.nvim_client.dap_get_frame_state(frame_id, expression)
+            scopes = state.get("scopes") or []
             if scopes:
                 result["scopes"] = [
                     Scope(
@@ -404,31 +406,30 @@ class DebugService:
                     for scope in scopes
                 ]
 
-                # Get variables for each scope
                 variables_by_scope: Dict[str, List[Variable]] = {}
+                raw_variables = state.get("variables") or {}
                 for scope in scopes:
-                    scope_name = scope["name"]
-                    vars_ref = scope["variables_reference"]
-                    if vars_ref > 0:
-                        variables = await self.nvim_client.dap_get_variables(vars_ref)
-                        if variables:
-                            variables_by_scope[scope_name] = [
-                                Variable(
-                                    name=var["name"],
-                                    value=var["value"],
-                                    type=var.get("type"),
-                                    variables_reference=var.get(
-                                        "variables_reference", 0
-                                    ),
-                                )
-                                for var in variables
-                            ]
+                    variables = raw_variables.get(scope["name"])
+                    if variables:
+                        variables_by_scope[scope["name"]] = [
+                            Variable(
+                                name=var["name"],
+                                value=var["value"],
+                                type=var.get("type"),
+                                variables_reference=var.get("variables_reference", 0),
+                            )
+                            for var in variables
+                        ]
 
                 result["variables"] = variables_by_scope
+            eval_result = state.get("evaluation")
+        elif expression:
+            eval_result = await self.nvim_client.dap_evaluate(expression, frame_id)
+        else:
+            eval_result = None
 
-        # Evaluate expression if provided
+        # Attach the evaluation result if an expression was given
         if expression:
-            eval_result = await self.nvim_client.dap_evaluate(expression, frame_id)
             if eval_result and "error" not in eval_result:
                 result["evaluation"] = EvaluateResult(
                     result=eval_result["result"],
@@ -103,7 +103,9 @@ class EditingService:
         try:
             # Open or create the buffer
             # For new files, this will create an empty buffer
-            await self.nvim_client.open_file(str(file_path), create_if_missing=True)
+            await self.nvim_client.open_file(
+                str(file_path), create_if_missing=True, wait_for_lsp=False
+            )
 
             # Read current buffer content (will be empty for new files)
             current_lines = await self.nvim_client.read_buffer(str(file_path))
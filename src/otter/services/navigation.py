@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from urllib.parse import unquote, urlparse
 
 from ..models.responses import (
@@ -16,6 +16,68 @@ from ..models.responses import (
     SearchResult,
 )
 
+# LSP SymbolKind enumeration -> our symbol type
+_SYMBOL_KIND_TYPES = {
+    1: "module",  # File
+    2: "module",  # Module
+    3: "module",  # Namespace
+    4: "module",  # Package
+    5: "class",  # Class
+    6: "method",  # Method
+    7: "property",  # Property
+    8: "variable",  # Field
+    9: "function",  # Constructor
+    10: "function",  # Enum
+    11: "function",  # Interface
+    12: "function",  # Function
+    13: "variable",  # Variable
+    14: "variable",  # Constant
+    15: "variable",  # String
+    16: "variable",  # Number
+    17: "variable",  # Boolean
+    18: "variable",  # Array
+    19: "variable",  # Object
+    20: "variable",  # Key
+    21: "variable",  # Null
+    22: "variable",  # EnumMember
+    23: "struct",  # Struct
+    24: "variable",  # Event
+    25: "function",  # Operator
+    26: "variable",  # TypeParameter
+}
+
+# LSP CompletionItemKind -> string
+_COMPLETION_KINDS = {
+    1: "text",
+    2: "method",
+    3: "function",
+    4: "constructor",
+    5: "field",
+    6: "variable",
+    7: "class",
+    8: "interface",
+    9: "module",
+    10: "property",
+    11: "unit",
+    12: "value",
+    13: "enum",
+    14: "keyword",
+    15: "snippet",
+    16: "color",
+    17: "file",
+    18: "reference",
+    19: "folder",
+    20: "enum_member",
+    21: "constant",
+    22: "struct",
+    23: "event",
+    24: "operator",
+    25: "type_parameter",
+}
+
+# Column offsets tried (nearest first) when hover finds nothing at the cursor
+_NEARBY_OFFSETS = (1, 2, -1, 3, -2, 4, -3)
+
 
 class NavigationService:
     def __init__(
@@ -516,37 +578,7 @@ class NavigationService:
         if kind is None:
             return "variable"
 
-        # LSP SymbolKind enumeration
-        kind_map = {
-            1: "module",  # File
-            2: "module",  # Module
-            3: "module",  # Namespace
-            4: "module",  # Package
-            5: "class",  # Class
-            6: "method",  # Method
-            7: "property",  # Property
-            8: "variable",  # Field
-            9: "function",  # Constructor
-            10: "function",  # Enum
-            11: "function",  # Interface
-            12: "function",  # Function
-            13: "variable",  # Variable
-            14: "variable",  # Constant
-            15: "variable",  # String
-            16: "variable",  # Number
-            17: "variable",  # Boolean
-            18: "variable",  # Array
-            19: "variable",  # Object
-            20: "variable",  # Key
-            21: "variable",  # Null
-            22: "variable",  # EnumMember
-            23: "struct",  # Struct
-            24: "variable",  # Event
-            25: "function",  # Operator
-            26: "variable",  # TypeParameter
-        }
-
-        return kind_map.get(kind, "variable")  # type: ignore[return-value]
+        return _SYMBOL_KIND_TYPES.get(kind, "variable")  # type: ignore[return-value]
 
     # ========================================================================
     # DEPRECATED METHODS - NO LONGER USED
@@ -781,6 +813,12 @@ class NavigationService:
             return ReferencesResult(references=[], total_count=0, grouped_by_file=[])
 
         references = []
+        # References per file, filled in the same pass (for grouped_by_file)
+        file_groups: Dict[str, List[Reference]] = {}
+        resolved_project = self.project_path.resolve()
+        # Per referenced file: (project-relative path, lines) - files with many
+        # references are read and resolved once, not once per reference
+        ref_files: Dict[str, Optional[Tuple[str, List[str]]]] = {}
         for location in lsp_result:
             try:
                 # Parse LSP location
@@ -795,13 +833,18 @@ class NavigationService:
                 ref_line = range_data["start"]["line"] + 1  # Convert to 1-indexed
                 ref_column = range_data["start"]["character"]
 
-                # Read the file to get context
-                ref_file_path = Path(ref_file)
-                if not ref_file_path.exists():
+                if ref_file not in ref_files:
+                    ref_files[ref_file] = self._load_reference_file(
+                        ref_file, resolved_project
+                    )
+                loaded = ref_files[ref_file]
+                if loaded is None:
                     continue
+                rel_file, lines = loaded
 
-                with open(ref_file_path, "r") as f:
-                    lines = f.readlines()
+                # Apply scope filtering if needed
+                if scope == "file" and rel_file != rel_input_file:
+                    continue
 
                 if ref_line > len(lines):
                     continue
@@ -810,49 +853,29 @@ class NavigationService:
                 context_line = lines[ref_line - 1].rstrip()
                 context = f"Line {ref_line}: {context_line}"
 
-                # Make file path relative to project if possible
-                try:
-                    resolved_ref_file = Path(ref_file).resolve()
-                    resolved_project = self.project_path.resolve()
-                    rel_file = str(resolved_ref_file.relative_to(resolved_project))
-                except ValueError:
-                    rel_file = ref_file
-
                 # Determine if this is the definition
                 is_definition = rel_file == rel_input_file and ref_line == line
 
+                # Filter out definition if requested
+                if exclude_definition and is_definition:
+                    continue
+
                 # Detect reference type based on context
                 ref_type = self._detect_reference_type(context_line, symbol)
 
-                references.append(
-                    Reference(
-                        file=rel_file,
-                        line=ref_line,
-                        column=ref_column,
-                        context=context,
-                        is_definition=is_definition,
-                        reference_type=ref_type,
-                    )
+                # Positional: (file, line, column, context, is_definition, reference_type)
+                ref = Reference(
+                    rel_file, ref_line, ref_column, context, is_definition, ref_type
                 )
+                references.append(ref)
+                group = file_groups.get(rel_file)
+                if group is None:
+                    group = file_groups[rel_file] = []
+                group.append(ref)
             except Exception:
                 # Skip malformed locations
                 continue
 
-        # Apply scope filtering if needed
-        if scope == "file":
-            references = [ref for ref in references if ref.file == rel_input_file]
-
-        # Filter out definition if requested
-        if exclude_definition:
-            references = [ref for ref in references if not ref.is_definition]
-
-        # Group references by file
-        file_groups: Dict[str, List[Reference]] = {}
-        for ref in references:
-            if ref.file not in file_groups:
-                file_groups[ref.file] = []
-            file_groups[ref.file].append(ref)
-
         grouped_by_file = [
             FileReferences(file=file_path, count=len(refs), references=refs)
             for file_path, refs in sorted(file_groups.items())
@@ -864,6 +887,28 @@ class NavigationService:
             grouped_by_file=grouped_by_file,
         )
 
+    def _load_reference_file(
+        self, ref_file: str, resolved_project: Path
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Read a referenced file and its path relative to the project if possible.
+
+        Returns:
+            (relative or original path, lines), or None if the file doesn't exist
+        """
+        ref_file_path = Path(ref_file)
+        if not ref_file_path.exists():
+            return None
+
+        with open(ref_file_path, "r") as f:
+            lines = f.readlines()
+
+        # Make file path relative to project if possible
+        try:
+            rel_file = str(ref_file_path.resolve().relative_to(resolved_project))
+        except ValueError:
+            rel_file = ref_file
+        return rel_file, lines
+
     def _detect_reference_type(self, context_line: str, symbol: str) -> Optional[str]:
         """Detect the type of reference based on context (language-agnostic).
 
@@ -1112,13 +1157,11 @@ class NavigationService:
         Returns:
             LSP hover result if found nearby, None otherwise
         """
-        # Try a few positions to the left and right
-        for offset in [1, 2, -1, 3, -2, 4, -3]:
-            nearby_col = max(0, column + offset)
-            result = await self.nvim_client.lsp_hover(file, line, nearby_col)  # type: ignore[union-attr]
-            if result:
-                return result
-        return None
+        # Try a few positions to the left and right, in one round-trip; the
+        # closest position with a result wins
+        positions = [(line, max(0, column + offset)) for offset in _NEARBY_OFFSETS]
+        results = await self.nvim_client.lsp_hover_batch(file, positions)  # type: ignore[union-attr]
+        return next((result for result in results if result), None)
 
     async def _parse_hover_response(
         self, lsp_hover: Dict[str, Any], file: str, line: int, column: int
@@ -1396,15 +1439,8 @@ class NavigationService:
             # Get sort text for ranking (LSP provides this for relevance ordering)
             sort_text = item.get("sortText", label)
 
-            completions.append(
-                Completion(
-                    text=text,
-                    kind=kind,
-                    detail=detail,
-                    documentation=documentation,
-                    sort_text=sort_text,
-                )
-            )
+            # Positional: (text, kind, detail, documentation, sort_text)
+            completions.append(Completion(text, kind, detail, documentation, sort_text))
 
         # Sort by LSP-provided sort_text (which reflects relevance)
         # LSP servers use sortText to rank by relevance, with more relevant items having
@@ -1463,31 +1499,4 @@ class NavigationService:
         19=Folder, 20=EnumMember, 21=Constant, 22=Struct, 23=Event,
         24=Operator, 25=TypeParameter
         """
-        kind_map = {
-            1: "text",
-            2: "method",
-            3: "function",
-            4: "constructor",
-            5: "field",
-            6: "variable",
-            7: "class",
-            8: "interface",
-            9: "module",
-            10: "property",
-            11: "unit",
-            12: "value",
-            13: "enum",
-            14: "keyword",
-            15: "snippet",
-            16: "color",
-            17: "file",
-            18: "reference",
-            19: "folder",
-            20: "enum_member",
-            21: "constant",
-            22: "struct",
-            23: "event",
-            24: "operator",
-            25: "type_parameter",
-        }
-        return kind_map.get(kind, "unknown")
+        return _COMPLETION_KINDS.get(kind, "unknown")
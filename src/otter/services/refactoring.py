@@ -105,14 +105,8 @@ class RefactoringService:
                     old_text = edit.get("oldText", "[symbol]")
                     new_text = edit["newText"]
 
-                    changes.append(
-                        Change(
-                            file=file_path,
-                            line=start_line,
-                            before=old_text,
-                            after=new_text,
-                        )
-                    )
+                    # Positional: (file, line, before, after)
+                    changes.append(Change(file_path, start_line, old_text, new_text))
 
         # Handle "changes" format (legacy/simpler format)
         elif "changes" in workspace_edit:
@@ -129,14 +123,8 @@ class RefactoringService:
                     old_text = edit.get("oldText", "[symbol]")
                     new_text = edit["newText"]
 
-                    changes.append(
-                        Change(
-                            file=file_path,
-                            line=start_line,
-                            before=old_text,
-                            after=new_text,
-                        )
-                    )
+                    # Positional: (file, line, before, after)
+                    changes.append(Change(file_path, start_line, old_text, new_text))
 
         return changes
 
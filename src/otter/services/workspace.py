@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import mmap
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from ..models.responses import (
     Diagnostic,
@@ -14,6 +15,148 @@ from ..models.responses import (
     SymbolsResult,
 )
 
+# Files at least this large are memory-mapped instead of read into memory, so
+# a line_range read only decodes the requested slice.
+_MMAP_THRESHOLD = 64 * 1024
+_COUNT_CHUNK = 1024 * 1024
+
+# "N|" prefixes for read_file's numbered output, built once and grown on demand
+# (up to _PREFIX_CACHE_LIMIT lines; longer files format the rest on the fly)
+_PREFIX_CACHE_LIMIT = 1 << 16
+_line_prefixes: List[str] = []
+
+# LSP severity: 1=Error, 2=Warning, 3=Information, 4=Hint
+_SEVERITIES: Dict[int, Literal["error", "warning", "info", "hint"]] = {
+    1: "error",
+    2: "warning",
+    3: "info",
+    4: "hint",
+}
+
+# LSP SymbolKind -> symbol type string
+_SYMBOL_KINDS = {
+    1: "file",
+    2: "module",
+    3: "namespace",
+    4: "package",
+    5: "class",
+    6: "method",
+    7: "property",
+    8: "field",
+    9: "constructor",
+    10: "enum",
+    11: "interface",
+    12: "function",
+    13: "variable",
+    14: "constant",
+    15: "string",
+    16: "number",
+    17: "boolean",
+    18: "array",
+}
+
+# Directories left out of get_project_structure regardless of options
+_ALWAYS_IGNORED = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+    }
+)
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    """DirEntry.is_dir() that treats unreadable entries as files, like Path.is_dir()."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _count_lines(data: Union[bytes, mmap.mmap]) -> int:
+    """Count lines the way readlines() would (a trailing partial line counts)."""
+    size = len(data)
+    if not size:
+        return 0
+    # mmap has no count(), so count newlines in bounded chunks
+    count = sum(
+        data[offset : offset + _COUNT_CHUNK].count(b"\n")
+        for offset in range(0, size, _COUNT_CHUNK)
+    )
+    if data[-1:] != b"\n":
+        count += 1
+    return count
+
+
+def _number_lines(lines: List[str], start_line: int, strip: bool = False) -> str:
+    """Render lines as "LINE_NUMBER|CONTENT", joined with newlines."""
+    end_line = start_line + len(lines)
+    cached_end = min(end_line, _PREFIX_CACHE_LIMIT + 1)
+    if len(_line_prefixes) < cached_end - 1:
+        _line_prefixes.extend(
+            f"{n}|" for n in range(len(_line_prefixes) + 1, cached_end)
+        )
+
+    if strip:
+        lines = list(map(str.rstrip, lines))
+    prefixes = _line_prefixes[start_line - 1 : cached_end - 1]
+    numbered = list(map(str.__add__, prefixes, lines))
+    if len(numbered) < len(lines):
+        # Past the cache, format number and line together in one pass
+        numbered.extend(
+            f"{n}|{line}"
+            for n, line in zip(
+                range(start_line + len(numbered), end_line), lines[len(numbered) :]
+            )
+        )
+    return "\n".join(numbered)
+
+
+def _line_offset(data: Union[bytes, mmap.mmap], lines: int, offset: int = 0) -> int:
+    """Byte offset just past the `lines`-th newline from offset, or -1."""
+    size = len(data)
+    if lines <= 0:
+        return offset
+    # Skip whole chunks by counting, then split only the chunk holding the line
+    while offset < size:
+        chunk = data[offset : offset + _COUNT_CHUNK]
+        newlines = chunk.count(b"\n")
+        if newlines >= lines:
+            return offset + len(chunk) - len(chunk.split(b"\n", lines)[-1])
+        lines -= newlines
+        offset += len(chunk)
+    return -1
+
+
+def _slice_lines(
+    data: Union[bytes, mmap.mmap], start: int, end: int, total_lines: int
+) -> List[str]:
+    """Decode lines start..end (1-indexed, inclusive) without decoding the rest."""
+    begin = _line_offset(data, start - 1)
+    if begin == -1:
+        return []
+    stop = len(data)
+    if end < total_lines:
+        stop = _line_offset(data, end - start + 1, begin)
+
+    return _decode_lines(data[begin:stop])
+
+
+def _decode_lines(raw: bytes) -> List[str]:
+    """Decode bytes into lines without their newlines (as readlines would split)."""
+    text = raw.decode("utf-8")
+    if not text:
+        return []
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    return lines
+
 
 class WorkspaceService:
     def __init__(
@@ -61,23 +204,70 @@ class WorkspaceService:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
-        # Get total line count first (for validation and metadata)
-        with open(file_path, "r", encoding="utf-8") as f:
-            all_file_lines = f.readlines()
-        total_lines = len(all_file_lines)
-
-        # Validate line_range if provided
-        if line_range:
-            start, end = line_range
-            if start < 1:
-                raise ValueError(f"Line range start must be >= 1, got {start}")
-            if end < start:
-                raise ValueError(f"Line range end ({end}) must be >= start ({start})")
-            if start > total_lines:
-                raise ValueError(
-                    f"Line range start ({start}) exceeds file length ({total_lines} lines)"
+        # If we need advanced features, we must use Neovim
+        use_nvim = self.nvim_client and (include_imports or include_diagnostics)
+
+        # Large files are memory-mapped so only the requested range gets decoded
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                data: Union[bytes, mmap.mmap] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
                 )
-            # Allow end to exceed total_lines - we'll just cap it
+            else:
+                data = f.read()
+
+        try:
+            if data.find(b"\r") != -1:
+                # Text-mode reads also end lines at "\r\n" and at a lone "\r";
+                # translate both so the counting and slicing below only need "\n"
+                normalized = data[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                if isinstance(data, mmap.mmap):
+                    data.close()
+                data = normalized
+
+            disk_lines: List[str] = []
+            if line_range or use_nvim:
+                # Get total line count first (for validation and metadata)
+                total_lines = _count_lines(data)
+            else:
+                # Whole file: one decode yields both the lines and their count
+                disk_lines = _decode_lines(data[:])
+                total_lines = len(disk_lines)
+
+            # Validate line_range if provided
+            if line_range:
+                start, end = line_range
+                if start < 1:
+                    raise ValueError(f"Line range start must be >= 1, got {start}")
+                if end < start:
+                    raise ValueError(
+                        f"Line range end ({end}) must be >= start ({start})"
+                    )
+                if start > total_lines:
+                    raise ValueError(
+                        f"Line range start ({start}) exceeds file length ({total_lines} lines)"
+                    )
+                # Allow end to exceed total_lines - we'll just cap it
+
+            # Determine the actual line range to read
+            actual_range = line_range
+            if line_range and context_lines > 0:
+                start, end = line_range
+                # Cap end at total_lines when adding context
+                actual_range = (
+                    max(1, start - context_lines),
+                    min(total_lines, end + context_lines),
+                )
+
+            # Decode only the lines we need (Neovim reads its own buffer)
+            if actual_range and not use_nvim:
+                start, end = actual_range
+                disk_lines = _slice_lines(
+                    data, start, min(end, total_lines), total_lines
+                )
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
 
         # Detect file language from extension
         language = None
@@ -106,19 +296,6 @@ class WorkspaceService:
             }
             language = ext_to_lang.get(file_path.suffix.lower())
 
-        # If we need advanced features, we must use Neovim
-        use_nvim = self.nvim_client and (include_imports or include_diagnostics)
-
-        # Determine the actual line range to read
-        actual_range = line_range
-        if line_range and context_lines > 0:
-            start, end = line_range
-            # Cap end at total_lines when adding context
-            actual_range = (
-                max(1, start - context_lines),
-                min(total_lines, end + context_lines),
-            )
-
         # Read file content
         if use_nvim and self.nvim_client is not None:
             # Ensure Neovim is started
@@ -131,26 +308,13 @@ class WorkspaceService:
             )
             # Add line numbers to content
             start_line = actual_range[0] if actual_range else 1
-            numbered_lines = [
-                f"{start_line + i}|{line}" for i, line in enumerate(lines)
-            ]
-            content = "\n".join(numbered_lines)
+            content = _number_lines(lines, start_line)
         else:
-            # Direct file read (fallback) - use already-read lines
-            if actual_range:
-                start, end = actual_range
-                # Convert to 0-indexed, cap end at total_lines
-                lines = all_file_lines[start - 1 : min(end, total_lines)]
-                start_line = start
-            else:
-                lines = all_file_lines
-                start_line = 1
+            # Direct file read (fallback) - use already-decoded lines
+            start_line = actual_range[0] if actual_range else 1
 
             # Add line numbers to content
-            numbered_lines = [
-                f"{start_line + i}|{line.rstrip()}" for i, line in enumerate(lines)
-            ]
-            content = "\n".join(numbered_lines)
+            content = _number_lines(disk_lines, start_line, strip=True)
 
         # Collect expanded imports if requested
         expanded_imports: Optional[Dict[str, List[str]]] = None
@@ -217,6 +381,7 @@ class WorkspaceService:
             nvim_diagnostics = await self.nvim_client.get_diagnostics(str(file_path))
 
             diagnostics = []
+            file = str(file_path)
             for diag in nvim_diagnostics:
                 # Convert from 0-indexed to 1-indexed line numbers
                 line = diag.get("lnum", 0) + 1
@@ -227,14 +392,15 @@ class WorkspaceService:
                     if line < start or line > end:
                         continue
 
+                # Positional: (severity, message, file, line, column, source)
                 diagnostics.append(
                     Diagnostic(
-                        file=str(file_path),
-                        line=line,
-                        column=diag.get("col", 0) + 1,  # Also 1-indexed
-                        message=diag.get("message", ""),
-                        severity=self._map_diagnostic_severity(diag.get("severity", 1)),
-                        source=diag.get("source", "lsp"),
+                        self._map_diagnostic_severity(diag.get("severity", 1)),
+                        diag.get("message", ""),
+                        file,
+                        line,
+                        diag.get("col", 0) + 1,  # Also 1-indexed
+                        diag.get("source", "lsp"),
                     )
                 )
 
@@ -247,14 +413,7 @@ class WorkspaceService:
         self, severity: int
     ) -> Literal["error", "warning", "info", "hint"]:
         """Map LSP severity codes to strings."""
-        # LSP severity: 1=Error, 2=Warning, 3=Information, 4=Hint
-        severity_map: Dict[int, Literal["error", "warning", "info", "hint"]] = {
-            1: "error",
-            2: "warning",
-            3: "info",
-            4: "hint",
-        }
-        return severity_map.get(severity, "info")
+        return _SEVERITIES.get(severity, "info")
 
     async def get_project_structure(
         self,
@@ -341,52 +500,42 @@ class WorkspaceService:
         Args:
             metadata: Dict to track file_count, directory_count, total_size
         """
-        if not path.exists() or not path.is_dir():
-            return {}
-
         # If we've reached max depth, return empty with truncation marker
         if current_depth >= max_depth:
             return {}
 
+        # scandir entries carry their file type (and cache stat), so each entry
+        # costs at most one stat call; a missing path or a file lists as empty
         try:
-            entries = sorted(
-                path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())
-            )
-        except (OSError, PermissionError):
+            with os.scandir(path) as it:
+                entries = [(_is_dir(entry), entry) for entry in it]
+        except OSError:
             return {}
+        entries.sort(key=lambda item: (not item[0], item[1].name.lower()))
 
         children: Dict[str, Any] = {}
 
-        for entry in entries:
+        for is_dir, entry in entries:
             # Skip hidden files if requested
             if not show_hidden and entry.name.startswith("."):
                 continue
 
             # Skip common directories that should always be ignored
-            if entry.name in {
-                "__pycache__",
-                ".git",
-                "node_modules",
-                ".venv",
-                "venv",
-                ".pytest_cache",
-                ".mypy_cache",
-                ".ruff_cache",
-            }:
+            if entry.name in _ALWAYS_IGNORED:
                 continue
 
             # Check exclude patterns
-            if self._matches_exclude_pattern(str(entry), exclude_patterns):
+            if self._matches_exclude_pattern(entry.path, exclude_patterns):
                 continue
 
-            if entry.is_dir():
+            if is_dir:
                 metadata["directory_count"] += 1
 
                 # Check if we can recurse further
                 if current_depth + 1 < max_depth:
                     # Recursively build subtree
                     subtree_children = self._build_tree_contents(
-                        entry,
+                        Path(entry.path),
                         current_depth + 1,
                         max_depth,
                         show_hidden,
@@ -415,7 +564,7 @@ class WorkspaceService:
                         size = entry.stat().st_size
                         file_info["size"] = size
                         metadata["total_size"] += size
-                    except (OSError, PermissionError):
+                    except OSError:
                         file_info["size"] = 0
                 children[entry.name] = file_info
 
@@ -584,7 +733,7 @@ class WorkspaceService:
                 type=symbol_type,
                 line=line,
                 column=column,
-                children=children if children else None,
+                children=tuple(children),  # exact-size; tuple([]) is the shared ()
                 parent=parent_name,
                 signature=detail,  # LSP detail often contains signature
                 detail=detail,
@@ -606,27 +755,7 @@ class WorkspaceService:
         7=Property, 8=Field, 9=Constructor, 10=Enum, 11=Interface,
         12=Function, 13=Variable, 14=Constant, etc.
         """
-        kind_map = {
-            1: "file",
-            2: "module",
-            3: "namespace",
-            4: "package",
-            5: "class",
-            6: "method",
-            7: "property",
-            8: "field",
-            9: "constructor",
-            10: "enum",
-            11: "interface",
-            12: "function",
-            13: "variable",
-            14: "constant",
-            15: "string",
-            16: "number",
-            17: "boolean",
-            18: "array",
-        }
-        return kind_map.get(kind, "unknown")
+        return _SYMBOL_KINDS.get(kind, "unknown")
 
     async def get_diagnostics(
         self,
@@ -705,6 +834,9 @@ class WorkspaceService:
             """)
 
             diagnostics = []
+            # Buffer name per bufnr: one lookup per buffer, and every diagnostic
+            # of a buffer shares the same path string
+            buf_paths: Dict[int, str] = {}
             for diag in all_diags:
                 # Get buffer path
                 bufnr = diag.get("bufnr", 0)
@@ -712,9 +844,11 @@ class WorkspaceService:
                     continue
 
                 # Get buffer name (file path)
-                buf_path = await self.nvim_client.execute_lua(f"""
-                    return vim.api.nvim_buf_get_name({bufnr})
-                """)
+                if bufnr not in buf_paths:
+                    buf_paths[bufnr] = await self.nvim_client.execute_lua(f"""
+                        return vim.api.nvim_buf_get_name({bufnr})
+                    """)
+                buf_path = buf_paths[bufnr]
 
                 if not buf_path:
                     continue
@@ -722,14 +856,15 @@ class WorkspaceService:
                 # Convert to 1-indexed
                 line = diag.get("lnum", 0) + 1
 
+                # Positional: (severity, message, file, line, column, source)
                 diagnostics.append(
                     Diagnostic(
-                        file=buf_path,
-                        line=line,
-                        column=diag.get("col", 0) + 1,
-                        message=diag.get("message", ""),
-                        severity=self._map_diagnostic_severity(diag.get("severity", 1)),
-                        source=diag.get("source", "lsp"),
+                        self._map_diagnostic_severity(diag.get("severity", 1)),
+                        diag.get("message", ""),
+                        buf_path,
+                        line,
+                        diag.get("col", 0) + 1,
+                        diag.get("source", "lsp"),
                     )
                 )
 
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
 
+@lru_cache(maxsize=32)
+def _resolve_root(project_root: Union[str, Path]) -> Path:
+    """Resolve a project root once - it is the same for every call on a server.
+
+    Path.resolve() stats every path component; the root changes at most once
+    per process, so there's no point repeating that on each tool call.
+    """
+    return Path(project_root).resolve()
+
+
 def resolve_workspace_path(
     path: Union[str, Path],
     project_root: Union[str, Path],
@@ -38,7 +49,7 @@ def resolve_workspace_path(
         Path("/fern_mono/main.py")
     """
     path_obj = Path(path)
-    project_root_obj = Path(project_root).resolve()
+    project_root_obj = _resolve_root(project_root)
 
     # If path is absolute, resolve and return
     if path_obj.is_absolute():
@@ -71,7 +82,7 @@ def make_relative_to_workspace(
         Path("src/main.py")
     """
     path_obj = Path(path).resolve()
-    project_root_obj = Path(project_root).resolve()
+    project_root_obj = _resolve_root(project_root)
 
     try:
         return path_obj.relative_to(project_root_obj)
@@ -108,7 +119,7 @@ def normalize_path_for_response(
         "/outside/file.py"
     """
     path_obj = Path(path).resolve()
-    project_root_obj = Path(project_root).resolve()
+    project_root_obj = _resolve_root(project_root)
 
     try:
         # Try to make relative - works for files inside workspace
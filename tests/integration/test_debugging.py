@@ -223,6 +223,30 @@ class TestDebugSessions:
         assert session.status in ["running", "stopped", "terminated"]
         assert session.file == str(calc_file)
 
+    @pytest.mark.asyncio
+    async def test_start_file_without_module_or_breakpoints(self, debug_service):
+        """Test a file launch leaves unset options out of the DAP config."""
+        service, test_file = debug_service
+
+        result = await service.nvim_client.dap_start_session(
+            session_id="file-launch", filepath=str(test_file)
+        )
+
+        assert result is not None
+        assert "error" not in result
+        assert result["file"] == str(test_file)
+        assert result.get("module") is None
+
+        info = await service.nvim_client.dap_get_session_status("file-launch")
+        config = next(
+            line
+            for line in info["diagnostic_info"]
+            if line.startswith("DAP Configuration")
+        )
+        assert "program =" in config
+        assert "module =" not in config
+        assert "vim.NIL" not in config
+
     @pytest.mark.asyncio
     async def test_start_session_with_breakpoints(
         self, ide_server: CliIdeServer, debug_project_dir
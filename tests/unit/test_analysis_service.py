@@ -0,0 +1,131 @@
+"""Unit tests for AnalysisService.
+
+Consolidated tests for:
+- _search_import_lines: reverse-dependency search over cached import lines
+
+ripgrep's file listing is replaced by a directory walk, so these tests need
+neither rg nor Neovim.
+"""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from otter.services.analysis import AnalysisService
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def rg_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Answer `rg --files <dir>` by walking the directory."""
+
+    def run(args: List[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        files = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(args[-1])
+            for name in sorted(names)
+        ]
+        return subprocess.CompletedProcess(args, 0, stdout="\n".join(files) + "\n")
+
+    monkeypatch.setattr(subprocess, "run", run)
+
+
+@pytest.fixture
+def service(temp_project_dir: Path) -> AnalysisService:
+    """AnalysisService over the temp project (Neovim is not used here)."""
+    return AnalysisService(nvim_client=MagicMock(), project_path=str(temp_project_dir))
+
+
+def _importers_of(service: AnalysisService, target: Path) -> List[str]:
+    pattern = re.compile(rf"\b(import|from)\b.*\b{re.escape(target.stem)}\b")
+    return service._search_import_lines(pattern, target)
+
+
+def _touch_later(path: Path) -> None:
+    """Move a file's mtime forward so a rewrite is seen even on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+# ============================================================================
+# Tests: Import-line cache
+# ============================================================================
+
+
+@pytest.mark.usefixtures("rg_files")
+class TestImportLineCache:
+    """Tests for the mtime-keyed import-line cache."""
+
+    def test_finds_importers(self, service: AnalysisService, temp_project_dir: Path):
+        """Test files importing the target are found, the target itself is not."""
+        target = temp_project_dir / "src" / "utils" / "helper.py"
+        (temp_project_dir / "src" / "app.py").write_text(
+            "import os\nfrom utils.helper import help\n\nhelp()\n"
+        )
+
+        assert _importers_of(service, target) == ["src/app.py"]
+
+    def test_keeps_only_import_like_lines(
+        self, service: AnalysisService, temp_project_dir: Path
+    ):
+        """Test the cache holds only lines that can match an import pattern."""
+        app = temp_project_dir / "src" / "app.py"
+        app.write_text("import os\nx = 1\nfrom helper import help\nprint(x)\n")
+
+        _importers_of(service, temp_project_dir / "src" / "utils" / "helper.py")
+
+        _, lines = service._import_lines[str(app)]
+        assert lines == ["import os", "from helper import help"]
+
+    def test_unchanged_file_is_not_reread(
+        self, service: AnalysisService, temp_project_dir: Path
+    ):
+        """Test a second search reuses the cached lines of unchanged files."""
+        target = temp_project_dir / "src" / "utils" / "helper.py"
+        app = temp_project_dir / "src" / "app.py"
+        app.write_text("from utils.helper import help\n")
+
+        _importers_of(service, target)
+        cached = service._import_lines[str(app)]
+
+        assert _importers_of(service, target) == ["src/app.py"]
+        assert service._import_lines[str(app)] is cached
+
+    def test_changed_file_is_reread(
+        self, service: AnalysisService, temp_project_dir: Path
+    ):
+        """Test a file whose mtime moved is read again."""
+        target = temp_project_dir / "src" / "utils" / "helper.py"
+        app = temp_project_dir / "src" / "app.py"
+        app.write_text("import os\n")
+
+        assert _importers_of(service, target) == []
+
+        app.write_text("import os\nfrom utils.helper import help\n")
+        _touch_later(app)
+
+        assert _importers_of(service, target) == ["src/app.py"]
+
+    def test_deleted_file_drops_out(
+        self, service: AnalysisService, temp_project_dir: Path
+    ):
+        """Test a file that is no longer listed leaves the cache."""
+        target = temp_project_dir / "src" / "utils" / "helper.py"
+        app = temp_project_dir / "src" / "app.py"
+        app.write_text("from utils.helper import help\n")
+
+        assert _importers_of(service, target) == ["src/app.py"]
+        assert str(app) in service._import_lines
+
+        app.unlink()
+
+        assert _importers_of(service, target) == []
+        assert str(app) not in service._import_lines
@@ -44,6 +44,8 @@ class TestConfigParsing:
             assert config.lsp.auto_detect is True
             assert config.lsp.lazy_load is True
             assert config.lsp.timeout_ms == 2000
+            assert config.lsp.completion_timeout_ms == 3000
+            assert config.lsp.rename_timeout_ms == 5000
             assert config.dap.enabled is True
             assert config.project_root == project_path
 
@@ -61,6 +63,7 @@ enabled = true
 auto_detect = false
 lazy_load = false
 timeout_ms = 3000
+completion_timeout_ms = 10000
 languages = ["python", "rust"]
 
 [lsp.python]
@@ -79,6 +82,8 @@ python.analysis.typeCheckingMode = "strict"
             assert config.lsp.auto_detect is False
             assert config.lsp.lazy_load is False
             assert config.lsp.timeout_ms == 3000
+            assert config.lsp.completion_timeout_ms == 10000
+            assert config.lsp.rename_timeout_ms == 5000
             assert config.lsp.languages == ["python", "rust"]
 
             # Check Python config
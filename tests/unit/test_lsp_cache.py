@@ -0,0 +1,84 @@
+"""Unit tests for NeovimClient's LSP result cache.
+
+Neovim is replaced by mocks: the tests only exercise when a cached result
+is reused and when it is fetched again.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from otter.neovim.client import NeovimClient
+
+
+@pytest.fixture
+def client(temp_project_dir: Path) -> NeovimClient:
+    """A client whose Neovim calls are mocked out."""
+    client = NeovimClient(project_path=str(temp_project_dir))
+    client.open_file = AsyncMock(return_value=1)  # type: ignore[method-assign]
+    client._wait_for_lsp_attach = AsyncMock()  # type: ignore[method-assign]
+    client._buffers_stamp = AsyncMock(return_value=(10, 1))  # type: ignore[method-assign]
+    return client
+
+
+class TestLspCache:
+    """Tests for reusing definition results (and not reusing references)."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_until_buffers_change(self, client: NeovimClient):
+        """Test a repeat call is served from the cache until a buffer is edited."""
+        location = {"uri": "file:///nowhere/helper.py", "range": {}}
+        client._lsp_request = AsyncMock(  # type: ignore[method-assign]
+            return_value=((10, 1), [location])
+        )
+
+        assert await client.lsp_definition("src/main.py", 1, 4) == [location]
+        # The miss took its stamp from the request itself
+        client._buffers_stamp.assert_not_awaited()
+
+        assert await client.lsp_definition("src/main.py", 1, 4) == [location]
+        assert client._lsp_request.await_count == 1
+
+        client._buffers_stamp.return_value = (11, 1)
+        await client.lsp_definition("src/main.py", 1, 4)
+        assert client._lsp_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unloaded_file_changed_on_disk(
+        self, client: NeovimClient, temp_project_dir: Path
+    ):
+        """Test a result is refetched when a file it points into changes on disk."""
+        helper = temp_project_dir / "src" / "utils" / "helper.py"
+        location = {"uri": helper.as_uri(), "range": {}}
+        client._lsp_request = AsyncMock(  # type: ignore[method-assign]
+            return_value=((10, 1), [location])
+        )
+
+        await client.lsp_definition("src/main.py", 1, 4)
+        await client.lsp_definition("src/main.py", 1, 4)
+        assert client._lsp_request.await_count == 1
+
+        # Rewritten behind Neovim's back (checkout, formatter): never loaded,
+        # so no buffer changedtick moves
+        helper.write_text("def help():\n    return 1\n")
+        stat = helper.stat()
+        os.utime(helper, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        await client.lsp_definition("src/main.py", 1, 4)
+        assert client._lsp_request.await_count == 2
+        client._buffers_stamp.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_references_not_cached(self, client: NeovimClient):
+        """Test references are always asked for again (any file can add one)."""
+        location = {"uri": "file:///nowhere/helper.py", "range": {}}
+        client._lsp_request_with_context = AsyncMock(  # type: ignore[method-assign]
+            return_value=[location]
+        )
+
+        assert await client.lsp_references("src/main.py", 1, 4) == [location]
+        assert await client.lsp_references("src/main.py", 1, 4) == [location]
+        assert client._lsp_request_with_context.await_count == 2
+        assert not client._lsp_cache
@@ -0,0 +1,279 @@
+"""Unit tests for the MCP server's tool-call plumbing.
+
+Consolidated tests for:
+- _single_flight: sharing one call between concurrent identical requests
+- _to_builtins: per-class dict converters matching dataclasses.asdict
+- _to_dict_offloaded: converting only large results in a worker thread
+"""
+
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+
+from otter import mcp_server
+from otter.mcp_server import (
+    _inflight,
+    _single_flight,
+    _to_builtins,
+    _to_dict_offloaded,
+)
+from otter.models.responses import (
+    BreakpointInfo,
+    DebugSession,
+    Diagnostic,
+    DiagnosticsResult,
+    FileContent,
+    Fix,
+    HoverInfo,
+    ProjectTree,
+    RelatedInfo,
+    Symbol,
+    SymbolsResult,
+)
+
+# ============================================================================
+# Tests: Single-flight
+# ============================================================================
+
+
+class TestSingleFlight:
+    """Tests for _single_flight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_invocation(self):
+        """Test identical concurrent calls run the call once and share its result."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        waiters = [
+            asyncio.create_task(_single_flight("shared", call)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["result", "result", "result"]
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test calls with different keys don't share a result."""
+
+        async def call(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            _single_flight("a", lambda: call("a")),
+            _single_flight("b", lambda: call("b")),
+        )
+
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_call_running(self):
+        """Test cancelling the first caller doesn't cancel the shared call."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(_single_flight("cancel", call))
+        second = asyncio.create_task(_single_flight("cancel", call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert await second == "result"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_waiter(self):
+        """Test an exception from the shared call is raised in every caller."""
+        release = asyncio.Event()
+
+        async def call() -> str:
+            await release.wait()
+            raise ValueError("boom")
+
+        waiters = [asyncio.create_task(_single_flight("fail", call)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert all(str(r) == "boom" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_key_removed_after_call(self):
+        """Test nothing is kept once the call finishes, whether it failed or not."""
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("boom")
+            return calls
+
+        with pytest.raises(ValueError):
+            await _single_flight("forget", call)
+        assert "forget" not in _inflight
+
+        # A later call runs again instead of reusing the finished one
+        assert await _single_flight("forget", call) == 2
+        assert "forget" not in _inflight
+
+
+# ============================================================================
+# Tests: Result conversion
+# ============================================================================
+
+
+def _json(value: Any) -> Any:
+    """Round-trip through JSON, as FastMCP does with tool results."""
+    return json.loads(json.dumps(value))
+
+
+class TestToBuiltins:
+    """Tests for _to_builtins against dataclasses.asdict."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            # Nested models, in a list and in a tuple-typed Sequence field
+            DiagnosticsResult(
+                diagnostics=[
+                    Diagnostic(
+                        severity="error",
+                        message="undefined name",
+                        file="src/a.py",
+                        line=3,
+                        column=4,
+                        source="pyright",
+                        fix=Fix(description="import it", edit={"range": [1, 2]}),
+                        related_information=(
+                            RelatedInfo(message="defined here", file="src/b.py"),
+                        ),
+                    ),
+                    Diagnostic(
+                        severity="hint",
+                        message="unused",
+                        file="src/a.py",
+                        line=9,
+                        column=0,
+                    ),
+                ],
+                total_count=2,
+            ),
+            # Recursive Sequence field, default empty tuple
+            SymbolsResult(
+                symbols=[
+                    Symbol(
+                        name="A",
+                        type="class",
+                        line=1,
+                        children=(
+                            Symbol(name="run", type="method", line=2, parent="A"),
+                        ),
+                    )
+                ],
+                file="src/a.py",
+                total_count=2,
+            ),
+            # Optional fields left as None, and filled in
+            HoverInfo(symbol="x", type=None, docstring=None, source_file=None),
+            FileContent(
+                content="1|import os",
+                total_lines=1,
+                expanded_imports={"os": ["path", "sep"]},
+                diagnostics=[
+                    Diagnostic(
+                        severity="warning", message="m", file="a.py", line=1, column=0
+                    )
+                ],
+            ),
+            # Dict passthrough next to a nested Sequence of models
+            DebugSession(
+                session_id="s1",
+                status="paused",
+                breakpoints=(BreakpointInfo(id=1, file="a.py", line=3, verified=True),),
+                launch_args=["--flag"],
+                launch_env={"DEBUG": "1"},
+                diagnostic_info=("started",),
+            ),
+        ],
+        ids=lambda model: type(model).__name__,
+    )
+    def test_matches_asdict(self, model: Any):
+        """Test the converted result serializes exactly like asdict() output."""
+        assert _json(_to_builtins(model)) == _json(asdict(model))
+
+    def test_plain_data_dict_passed_through(self):
+        """Test Dict[str, Any] fields are copied as-is instead of walked."""
+        tree = {"src": {"type": "directory", "children": {"a.py": {"type": "file"}}}}
+        project = ProjectTree(root="/project", tree=tree, file_count=1)
+
+        result = _to_builtins(project)
+
+        assert result["tree"] is tree
+        assert _json(result) == _json(asdict(project))
+
+    def test_sequence_fields_become_lists(self):
+        """Test tuple-typed fields convert to lists, so the output is JSON-shaped."""
+        symbol = Symbol(name="f", type="function", line=1)
+
+        result = _to_builtins(symbol)
+
+        assert result["children"] == []
+        assert isinstance(result["children"], list)
+
+
+class TestToDictOffloaded:
+    """Tests for _to_dict_offloaded."""
+
+    @staticmethod
+    def _result(count: int) -> DiagnosticsResult:
+        diagnostics = [
+            Diagnostic(severity="error", message="m", file="a.py", line=i, column=0)
+            for i in range(count)
+        ]
+        return DiagnosticsResult(diagnostics=diagnostics, total_count=count)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("count", "offloaded"),
+        [(3, False), (mcp_server._OFFLOAD_MIN_ITEMS, True)],
+    )
+    async def test_offloads_only_large_results(
+        self, monkeypatch: pytest.MonkeyPatch, count: int, offloaded: bool
+    ):
+        """Test small results are converted inline and large ones in a thread."""
+        threaded = []
+        to_thread = asyncio.to_thread
+
+        async def record_to_thread(func, *args):
+            threaded.append(func)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", record_to_thread)
+        result = await _to_dict_offloaded(self._result(count), count)
+
+        assert result["total_count"] == count
+        assert len(result["diagnostics"]) == count
+        assert bool(threaded) is offloaded
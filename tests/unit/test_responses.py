@@ -0,0 +1,26 @@
+"""Unit tests for response models."""
+
+from dataclasses import is_dataclass
+
+import pytest
+
+from otter.models import responses
+from otter.models.responses import Reference
+
+MODELS = [
+    getattr(responses, name)
+    for name in responses.__all__
+    if is_dataclass(getattr(responses, name))
+]
+
+
+@pytest.mark.parametrize("cls", MODELS, ids=lambda cls: cls.__name__)
+def test_models_use_slots(cls):
+    """Every response model is slotted (no per-instance __dict__)."""
+    assert "__slots__" in cls.__dict__
+
+
+def test_instances_have_no_dict():
+    """Slotted instances carry no __dict__."""
+    reference = Reference("a.py", 1, 0, "Line 1: x = 1")
+    assert not hasattr(reference, "__dict__")
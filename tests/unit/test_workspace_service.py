@@ -482,6 +482,92 @@ class TestReadFile:
         assert result.content == "2|line2\n3|line3"
         assert result.total_lines == 3
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("newline", ["\r\n", "\r"])
+    async def test_read_carriage_return_line_endings(
+        self, temp_project_dir: Path, newline: str
+    ):
+        """Test CRLF and CR-only files split into lines like a text-mode read."""
+        test_file = temp_project_dir / "test.py"
+        test_file.write_bytes(newline.join(["a = 1", "b = 2", "c = 3", ""]).encode())
+
+        service = WorkspaceService(project_path=str(temp_project_dir))
+        whole = await service.read_file("test.py")
+        assert whole.content == "1|a = 1\n2|b = 2\n3|c = 3"
+        assert whole.total_lines == 3
+
+        result = await service.read_file("test.py", line_range=(2, 3))
+        assert result.content == "2|b = 2\n3|c = 3"
+        assert result.total_lines == 3
+
+        # Memory-mapped files take the same path
+        big_file = temp_project_dir / "big.py"
+        big_file.write_bytes(
+            newline.join(f"value_{i} = {i}" for i in range(1, 10001)).encode()
+        )
+        tail = await service.read_file("big.py", line_range=(9999, 10000))
+        assert tail.content == "9999|value_9999 = 9999\n10000|value_10000 = 10000"
+        assert tail.total_lines == 10000
+
+    @pytest.mark.asyncio
+    async def test_read_large_file_range(self, temp_project_dir: Path):
+        """Test line ranges on a file large enough to be memory-mapped."""
+        test_file = temp_project_dir / "big.py"
+        test_file.write_text("\n".join(f"value_{i} = {i}  " for i in range(1, 10001)))
+
+        service = WorkspaceService(project_path=str(temp_project_dir))
+        result = await service.read_file("big.py", line_range=(5000, 5002))
+
+        assert result.content == (
+            "5000|value_5000 = 5000\n5001|value_5001 = 5001\n5002|value_5002 = 5002"
+        )
+        assert result.total_lines == 10000
+
+        tail = await service.read_file("big.py", line_range=(9999, 20000))
+        assert tail.content == "9999|value_9999 = 9999\n10000|value_10000 = 10000"
+
+    @pytest.mark.asyncio
+    async def test_read_range_across_count_chunks(
+        self, temp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test line ranges whose offsets fall in later newline-count chunks."""
+        from otter.services import workspace
+
+        monkeypatch.setattr(workspace, "_COUNT_CHUNK", 1000)
+        lines = [f"v{i} = {'x' * (i % 7)}" for i in range(1, 20001)]
+        test_file = temp_project_dir / "big.py"
+        test_file.write_text("\n".join(lines) + "\n")
+
+        service = WorkspaceService(project_path=str(temp_project_dir))
+        for start, end in [(1, 3), (1234, 1240), (15000, 15049), (19998, 20000)]:
+            result = await service.read_file("big.py", line_range=(start, end))
+            assert result.content == "\n".join(
+                f"{n}|{lines[n - 1].rstrip()}" for n in range(start, end + 1)
+            )
+            assert result.total_lines == 20000
+
+        whole = await service.read_file("big.py")
+        assert whole.total_lines == 20000
+        assert whole.content.endswith("\n20000|v20000 = x")
+
+    @pytest.mark.asyncio
+    async def test_line_numbers_past_prefix_cache(
+        self, temp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test line numbering across and beyond the cached prefix range."""
+        from otter.services import workspace
+
+        monkeypatch.setattr(workspace, "_PREFIX_CACHE_LIMIT", 3000)
+        test_file = temp_project_dir / "big.py"
+        test_file.write_text("\n".join(f"v{i}" for i in range(1, 5001)))
+
+        service = WorkspaceService(project_path=str(temp_project_dir))
+        result = await service.read_file("big.py", line_range=(2999, 3002))
+        assert result.content == "2999|v2999\n3000|v3000\n3001|v3001\n3002|v3002"
+
+        result = await service.read_file("big.py", line_range=(4999, 5000))
+        assert result.content == "4999|v4999\n5000|v5000"
+
     @pytest.mark.asyncio
     async def test_include_diagnostics(self, temp_project_dir: Path):
         """Test including LSP diagnostics."""